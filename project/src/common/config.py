@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 
 def env(name: str, default: str | None = None) -> str:
@@ -8,13 +9,40 @@ def env(name: str, default: str | None = None) -> str:
     return v
 
 
+# Env vars are fixed for the lifetime of a pipeline step; resolve each one once.
+@lru_cache(maxsize=1)
 def get_tracking_uri() -> str:
     return env("MLFLOW_TRACKING_URI", "http://localhost:5000")
 
 
+@lru_cache(maxsize=1)
 def get_experiment_name() -> str:
     return env("EXPERIMENT_NAME", "breast-cancer-platform")
 
 
+@lru_cache(maxsize=1)
 def get_model_name() -> str:
     return env("MODEL_NAME", "breast_cancer_clf")
+
+
+@lru_cache(maxsize=1)
+def use_subprocess_steps() -> bool:
+    """Run orchestrated steps as separate `python -m` processes (opt-in)."""
+    return env("ORCHESTRATE_SUBPROCESS", "0") == "1"
+
+
+@lru_cache(maxsize=1)
+def is_prod_mode() -> bool:
+    return env("PROD_MODE", "0") == "1"
+
+
+def clear_config_cache() -> None:
+    """Forget cached env lookups (for tests that change the environment)."""
+    for getter in (
+        get_tracking_uri,
+        get_experiment_name,
+        get_model_name,
+        use_subprocess_steps,
+        is_prod_mode,
+    ):
+        getter.cache_clear()
@@ -3,10 +3,13 @@ from __future__ import annotations
 # Centralized constants across pipeline steps.
 
 # Contracts schema versions
-DATASET_FINGERPRINT_SCHEMA_VERSION = "dataset_fingerprint/v1"
+DATASET_FINGERPRINT_SCHEMA_VERSION = "dataset_fingerprint/v2"
 MODEL_REF_SCHEMA_VERSION = "model_ref/v1"
 FEATURE_STATS_SCHEMA_VERSION = "feature_stats/v1"
 
+# Dataset fingerprinting: hash columns on a thread pool at or above this width
+PARALLEL_HASH_MIN_COLUMNS = 64
+
 # MLflow tags (keys)
 TAG_STEP = "step"
 TAG_MODEL_NAME = "model_name"
@@ -16,6 +19,8 @@ TAG_DATASET_CONTENT_HASH = "dataset_content_hash"
 TAG_DATASET_SCHEMA_HASH = "dataset_schema_hash"
 TAG_ROW_COUNT = "row_count"
 TAG_DATA_SOURCE_URI = "data_source_uri"
+TAG_DATASET_FILE_HASH = "dataset_file_hash"
+TAG_DATA_SOURCE_FILE_HASH = "data_source_file_hash"
 
 # Promotion guardrail tags
 # NOTE: Dataset lineage already exists as multiple tags (content/schema hashes, row_count, uri).
@@ -66,4 +71,6 @@ LABEL_COL = "target"
 RAW_CSV = "raw.csv"
 TRAIN_CSV = "train.csv"
 TEST_CSV = "test.csv"
+TRAIN_PARQUET = "train.parquet"
+TEST_PARQUET = "test.parquet"
 ART_PREPROCESSOR = "preprocessor.joblib"
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+
+def read_csv(
+    path: Path,
+    column_types: Mapping[str, str] | None = None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Read a CSV with Arrow's multithreaded parser and hand back a pandas frame.
+
+    `column_types` (Arrow aliases such as "int8") are applied by the parser, so
+    no cast copy follows; `columns` skips converting everything else.
+    `self_destruct` frees each Arrow column as soon as it is converted, so peak
+    memory stays close to one copy of the data.
+    """
+    convert_options = pa_csv.ConvertOptions(
+        column_types={
+            name: pa.type_for_alias(alias)
+            for name, alias in (column_types or {}).items()
+        },
+        include_columns=list(columns) if columns else None,
+    )
+    table = pa_csv.read_csv(path, convert_options=convert_options)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write `df` (without its index) as CSV via Arrow."""
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write `df` (without its index) as zstd-compressed Parquet (level 1: fast)."""
+    df.to_parquet(
+        path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=1,
+        index=False,
+    )
+
+
+def read_dataset(
+    parquet_path: Path,
+    csv_path: Path,
+    column_types: Mapping[str, str] | None = None,
+) -> pd.DataFrame:
+    """Prefer the Parquet copy of a dataset, falling back to its CSV.
+
+    Parquet carries its own dtypes; `column_types` only applies to the CSV
+    fallback and should match what the Parquet writer stored.
+    """
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    return read_csv(csv_path, column_types=column_types)
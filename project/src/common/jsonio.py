@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+# Shared encoder settings for every JSON artifact/contract we write.
+_PRETTY_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+loads = orjson.loads
+
+
+def dumps_pretty(payload: Any) -> bytes:
+    """Indented, key-sorted JSON (stable across runs, diff-friendly)."""
+    return orjson.dumps(payload, option=_PRETTY_OPTS)
+
+
+def dumps_compact(payload: Any) -> bytes:
+    """Compact JSON in insertion order (for hashing)."""
+    return orjson.dumps(payload)
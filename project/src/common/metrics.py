@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
+
+def binary_metrics(y_true: Any, proba: Any, threshold: float = 0.5) -> dict[str, float]:
+    """Accuracy, F1 and ROC AUC for a binary classifier.
+
+    Accuracy and F1 come from one confusion-count pass over bool buffers rather
+    than separate sklearn sweeps; ROC AUC still needs the scores themselves.
+    """
+    scores = np.asarray(proba, dtype=np.float64).ravel()
+    truth = np.asarray(y_true).ravel().astype(bool, copy=False)
+    pred = scores >= threshold
+
+    n = truth.size
+    tp = int(np.count_nonzero(pred & truth))
+    n_pred = int(np.count_nonzero(pred))
+    n_true = int(np.count_nonzero(truth))
+    fp = n_pred - tp
+    fn = n_true - tp
+    tn = n - tp - fp - fn
+
+    f1_denom = 2 * tp + fp + fn
+    return {
+        "accuracy": (tp + tn) / n if n else 0.0,
+        "f1": 2 * tp / f1_denom if f1_denom else 0.0,
+        "roc_auc": float(roc_auc_score(truth, scores)),
+    }
@@ -1,24 +1,94 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import mlflow
+from mlflow.exceptions import MlflowException
 from mlflow.tracking import MlflowClient
 
+from src.common.jsonio import dumps_pretty, loads
 
-def ensure_experiment(name: str) -> str:
-    exp = mlflow.get_experiment_by_name(name)
-    if exp is None:
-        return mlflow.create_experiment(name)
+# name -> experiment_id per tracking URI, so repeat runs skip the name search.
+EXPERIMENT_ID_CACHE: Path = Path.home() / ".cache" / "mlflow_exp_ids.json"
+
+# Upper bound on concurrent registry calls in `set_model_version_tags`.
+MAX_TAG_WRITERS = 8
+
+
+def _load_experiment_ids() -> dict[str, str]:
+    try:
+        cached = loads(EXPERIMENT_ID_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _store_experiment_id(key: str, experiment_id: str) -> None:
+    ids = _load_experiment_ids()
+    ids[key] = experiment_id
+    try:
+        EXPERIMENT_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        EXPERIMENT_ID_CACHE.write_bytes(dumps_pretty(ids))
+    except OSError:
+        pass  # cache is an optimization only
+
+
+def set_active_experiment(name: str) -> str:
+    """Activate experiment `name` (creating it if needed) and return its id.
+
+    `mlflow.set_experiment` already fetches the experiment it activates, so a
+    cached id is handed straight to it: one tracking call on the warm path
+    instead of a lookup followed by set_experiment's own lookup.
+    """
+    key = f"{mlflow.get_tracking_uri()}|{name}"
+    cached_id = _load_experiment_ids().get(key)
+    if cached_id is not None:
+        try:
+            exp = mlflow.set_experiment(experiment_id=cached_id)
+        except MlflowException:
+            exp = None  # deleted or unknown id: fall through to the name path
+        if exp is not None and exp.name == name:
+            return cached_id
+
+    exp = mlflow.set_experiment(experiment_name=name)  # get-or-create
+    _store_experiment_id(key, exp.experiment_id)
     return exp.experiment_id
 
 
-def client() -> MlflowClient:
+@lru_cache(maxsize=1)
+def get_client() -> MlflowClient:
+    """Process-wide MlflowClient, so its HTTP session (keep-alive pool) is reused."""
     return MlflowClient()
 
 
+def reset_client() -> None:
+    """Drop the cached client, e.g. after the tracking URI changed (tests)."""
+    get_client.cache_clear()
+
+
+def set_model_version_tags(
+    client: MlflowClient, name: str, version: str, tags: Mapping[str, str]
+) -> None:
+    """Write several model-version tags concurrently.
+
+    The model registry has no batch-tag endpoint, so the per-tag REST calls are
+    overlapped on a small thread pool instead of being issued back to back.
+    """
+    if not tags:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(tags), MAX_TAG_WRITERS)) as pool:
+        futures = [
+            pool.submit(client.set_model_version_tag, name, version, key, value)
+            for key, value in tags.items()
+        ]
+    for f in futures:
+        f.result()
+
+
 def write_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    path.write_bytes(dumps_pretty(payload))
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+# Small values handed from one pipeline step to the next (e.g. the train run id).
+# When orchestrate runs steps in-process it enables in-memory mode and they never
+# touch the filesystem; standalone/subprocess steps exchange them as files.
+_state: dict[str, str] = {}
+_in_memory = False
+
+
+def use_in_memory(enabled: bool = True) -> None:
+    global _in_memory
+    _in_memory = enabled
+    _state.clear()
+
+
+def put(path: Path, value: str) -> None:
+    if _in_memory:
+        _state[str(path)] = value
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(value, encoding="utf-8")
+
+
+def get(path: Path) -> str:
+    """Value stored for `path`; falls back to reading the file.
+
+    Raises:
+      FileNotFoundError: if the value was never put in memory and the file is missing.
+    """
+    try:
+        return _state[str(path)]
+    except KeyError:
+        return path.read_text(encoding="utf-8").strip()
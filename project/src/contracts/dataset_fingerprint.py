@@ -1,26 +1,36 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import mmap
 import os
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import xxhash
+from joblib import Parallel, delayed
 
+from src.common.config import is_prod_mode
 from src.common.constants import (
     DATASET_FINGERPRINT_SCHEMA_VERSION,
+    PARALLEL_HASH_MIN_COLUMNS,
     TAG_DATASET_CONTENT_HASH,
+    TAG_DATASET_FILE_HASH,
     TAG_DATASET_SCHEMA_HASH,
+    TAG_DATA_SOURCE_FILE_HASH,
     TAG_DATA_SOURCE_URI,
     TAG_GIT_SHA,
     TAG_ROW_COUNT,
 )
+from src.common.jsonio import dumps_compact, dumps_pretty, loads
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatasetFingerprint:
     """Minimal dataset lineage contract for a model training run."""
 
@@ -29,16 +39,25 @@ class DatasetFingerprint:
     dataset_schema_hash: str
     row_count: int
     data_source_uri: str
+    # Byte-level hash of the source file (see `fingerprint_file`); optional.
+    dataset_file_hash: Optional[str] = None
+    # sha256 of the same file, for artifact-integrity checks; optional.
+    data_source_file_hash: Optional[str] = None
     schema_version: str = DATASET_FINGERPRINT_SCHEMA_VERSION
 
     def as_tags(self) -> dict[str, str]:
-        return {
+        tags = {
             TAG_GIT_SHA: self.git_sha,
             TAG_DATASET_CONTENT_HASH: self.dataset_content_hash,
             TAG_DATASET_SCHEMA_HASH: self.dataset_schema_hash,
             TAG_ROW_COUNT: str(self.row_count),
             TAG_DATA_SOURCE_URI: self.data_source_uri,
         }
+        if self.dataset_file_hash:
+            tags[TAG_DATASET_FILE_HASH] = self.dataset_file_hash
+        if self.data_source_file_hash:
+            tags[TAG_DATA_SOURCE_FILE_HASH] = self.data_source_file_hash
+        return tags
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -48,10 +67,13 @@ class DatasetFingerprint:
             "dataset_schema_hash": self.dataset_schema_hash,
             "row_count": self.row_count,
             "data_source_uri": self.data_source_uri,
+            "dataset_file_hash": self.dataset_file_hash,
+            "data_source_file_hash": self.data_source_file_hash,
         }
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+    def to_json(self, pretty: bool = False) -> str:
+        dumps = dumps_pretty if pretty else dumps_compact
+        return dumps(self.to_dict()).decode("utf-8")
 
     @staticmethod
     def from_dict(payload: Mapping[str, Any]) -> "DatasetFingerprint":
@@ -67,28 +89,42 @@ class DatasetFingerprint:
             dataset_schema_hash=str(payload["dataset_schema_hash"]),
             row_count=int(payload["row_count"]),
             data_source_uri=str(payload["data_source_uri"]),
+            dataset_file_hash=payload.get("dataset_file_hash") or None,
+            data_source_file_hash=payload.get("data_source_file_hash") or None,
         )
 
     @staticmethod
     def from_json(payload: str) -> "DatasetFingerprint":
-        return DatasetFingerprint.from_dict(json.loads(payload))
+        return DatasetFingerprint.from_dict(loads(payload))
+
+
+def _fast_hash(payload: bytes | mmap.mmap) -> str:
+    # Lineage fingerprint, not a security boundary: a fast non-cryptographic hash is enough.
+    return xxhash.xxh3_128_hexdigest(payload)
 
 
-def _sha256_bytes(payload: bytes) -> str:
-    return hashlib.sha256(payload).hexdigest()
+def _is_buffer_dtype(dtype: Any) -> bool:
+    """True for plain numpy numeric/bool dtypes whose buffer can be hashed as-is."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufc"
 
 
+@lru_cache(maxsize=1)
 def get_git_sha() -> str:
     """Return current git SHA if available.
 
     Order of precedence:
       1) GIT_SHA env var (recommended in CI)
-      2) `git rev-parse HEAD` if repo is present in container
+      2) `git rev-parse HEAD` if repo is present in container (not in PROD_MODE)
       3) "unknown"
+
+    Cached: the SHA cannot change within one process, and the git fallback forks.
     """
     env_sha = os.getenv("GIT_SHA")
     if env_sha:
         return env_sha.strip()
+    if is_prod_mode():
+        # Production images bake GIT_SHA in at build time; never fork git there.
+        return "unknown"
 
     try:
         out = subprocess.check_output(
@@ -99,28 +135,157 @@ def get_git_sha() -> str:
         return "unknown"
 
 
+def _column_descriptor(name: Any, dtype: Any) -> bytes:
+    return f"{name}:{dtype}\n".encode()
+
+
 def schema_hash(df: pd.DataFrame) -> str:
-    """Hash only schema: column names + dtypes."""
-    schema = [(str(c), str(df[c].dtype)) for c in df.columns]
-    payload = json.dumps(schema, separators=(",", ":"), sort_keys=False).encode("utf-8")
-    return _sha256_bytes(payload)
+    """Hash only schema: column names + dtypes (independent of column order)."""
+    h = xxhash.xxh3_128()
+    for c in sorted(df.columns):
+        h.update(_column_descriptor(c, df[c].dtype))
+    return h.hexdigest()
+
+
+def _sort_rows(df: pd.DataFrame, index_cols: Optional[Sequence[str]]) -> pd.DataFrame:
+    if not index_cols:
+        return df
+    missing = [c for c in index_cols if c not in df.columns]
+    if missing:
+        raise ValueError(f"index_cols not in DataFrame: {missing}")
+    if len(index_cols) == 1:
+        key = df[index_cols[0]]
+        if _is_buffer_dtype(key.dtype) and key.dtype.kind != "c":
+            # Single numeric key: stable argsort on the raw buffer (radix sort for ints).
+            order = np.argsort(key.to_numpy(copy=False), kind="stable")
+            return df.take(order)
+    return df.sort_values(list(index_cols), kind="mergesort")
+
+
+def _column_buffer(col: pd.Series) -> memoryview:
+    """Byte view of one column's values (row index excluded)."""
+    if _is_buffer_dtype(col.dtype):
+        arr = col.to_numpy(copy=False)
+    else:
+        # categorize=False: factorizing first only pays off for low-cardinality
+        # columns and is several times slower on mostly-unique ones.
+        arr = pd.util.hash_pandas_object(col, index=False, categorize=False).values
+    if not arr.flags.c_contiguous:
+        arr = np.ascontiguousarray(arr)
+    # Byte view over the existing buffer: xxhash reads it in place, no copy.
+    return memoryview(arr).cast("B")
+
+
+def _is_text_dtype(dtype: Any) -> bool:
+    return pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype)
+
+
+def _utf8_buffers(col: pd.Series) -> Optional[tuple[np.ndarray, memoryview]]:
+    """(per-row byte lengths, concatenated UTF-8 bytes) of an all-string column.
+
+    Nulls get length -1. Returns None when the column holds non-string values.
+    """
+    try:
+        arr = pa.array(col, type=pa.large_string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if len(arr) == 0:
+        return np.empty(0, dtype=np.int64), memoryview(b"")
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)[
+        arr.offset : arr.offset + len(arr) + 1
+    ]
+    lengths = np.diff(offsets)
+    if arr.null_count:
+        lengths[arr.is_null().to_numpy(zero_copy_only=False)] = -1
+    data = memoryview(data_buf) if data_buf is not None else memoryview(b"")
+    return lengths, data[offsets[0] : offsets[-1]]
+
+
+def _column_digest(parts: Sequence[pd.Series]) -> bytes:
+    """xxh3-128 digest of one column streamed across `parts` (e.g. train, test).
+
+    Equal to the digest of the concatenated column, without building it. String
+    columns hash their raw UTF-8 bytes plus row lengths (via Arrow) instead of
+    the per-row SipHash in `hash_pandas_object`.
+    """
+    h = xxhash.xxh3_128()
+    if _is_text_dtype(parts[0].dtype):
+        utf8 = [u for u in map(_utf8_buffers, parts) if u is not None]
+        if len(utf8) == len(parts):
+            lengths_h = xxhash.xxh3_128()
+            for lengths, data in utf8:
+                lengths_h.update(lengths.tobytes())
+                h.update(data)
+            h.update(lengths_h.digest())
+            return h.digest()
+    for col in parts:
+        h.update(_column_buffer(col))
+    return h.digest()
+
+
+def _compute_hashes(
+    frames: Sequence[pd.DataFrame], index_cols: Optional[Sequence[str]]
+) -> tuple[str, str]:
+    """Schema and content hashes of `frames` (which share one schema) in one pass.
+
+    Columns are walked in sorted order. Each `name:dtype` descriptor feeds both
+    hashers; the column digest (see `_column_digest`), streamed across all frames
+    in order, feeds only the content hasher, so the result equals hashing the
+    concatenated frame. Wide frames hash their columns on a thread pool; the
+    fold order is fixed, so the result does not depend on scheduling.
+    """
+    sorted_frames = [_sort_rows(df, index_cols) for df in frames]
+    first = sorted_frames[0]
+    cols = sorted(first.columns)
+    parts = [[df[c] for df in sorted_frames] for c in cols]
+    if len(cols) >= PARALLEL_HASH_MIN_COLUMNS:
+        digests = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(_column_digest)(p) for p in parts
+        )
+    else:
+        digests = [_column_digest(p) for p in parts]
+
+    schema_h = xxhash.xxh3_128()
+    content_h = xxhash.xxh3_128()
+    for c, digest in zip(cols, digests):
+        descriptor = _column_descriptor(c, first[c].dtype)
+        schema_h.update(descriptor)
+        content_h.update(descriptor)
+        content_h.update(digest)
+    return schema_h.hexdigest(), content_h.hexdigest()
 
 
 def content_hash(
     df: pd.DataFrame, *, index_cols: Optional[Sequence[str]] = None
 ) -> str:
-    """Hash dataset content in a deterministic way."""
-    df2 = df.copy()
-    df2 = df2.reindex(sorted(df2.columns), axis=1)
+    """Hash dataset content in a deterministic way.
 
-    if index_cols:
-        missing = [c for c in index_cols if c not in df2.columns]
-        if missing:
-            raise ValueError(f"index_cols not in DataFrame: {missing}")
-        df2 = df2.sort_values(list(index_cols), kind="mergesort").reset_index(drop=True)
+    Each column (sorted by name) contributes its name, dtype and an xxh3-128
+    digest of its values.
+    """
+    return _compute_hashes([df], index_cols)[1]
 
-    row_hashes = pd.util.hash_pandas_object(df2, index=True).to_numpy()
-    return _sha256_bytes(row_hashes.tobytes())
+
+def fingerprint_file(path: Path) -> str:
+    """xxh3-128 over the raw bytes of `path`, read through a memory map.
+
+    Byte-identical semantics: unlike `content_hash`, any re-serialization of the
+    same rows (column order, float formatting, line endings) changes the result.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return _fast_hash(b"")
+        with mm:
+            return _fast_hash(mm)
+
+
+def file_content_hash(path: Path) -> str:
+    """sha256 of a file, streamed in fixed-size blocks by `hashlib.file_digest`."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def compute_fingerprint(
@@ -129,21 +294,44 @@ def compute_fingerprint(
     test_df: pd.DataFrame,
     data_source_uri: str,
     index_cols: Optional[Sequence[str]] = None,
+    data_file: Optional[Path] = None,
 ) -> DatasetFingerprint:
-    """Fingerprint over training+test membership."""
-    combined = pd.concat([train_df, test_df], axis=0, ignore_index=True)
+    """Fingerprint over training+test membership.
+
+    Columns are streamed train-then-test in the pass that yields the schema
+    hash, so the content hash equals `content_hash(pd.concat([train_df,
+    test_df]))` without building the combined frame. With `index_cols`, rows
+    are sorted within each split, not across them: the hash is that of the
+    separately sorted splits, concatenated, so moving a row between train and
+    test changes it. It therefore differs from `content_hash(combined,
+    index_cols=...)`. If `data_file` is given, its raw bytes are hashed too
+    (`dataset_file_hash`, plus sha256 `data_source_file_hash`).
+    """
+    train_schema = {str(c): str(train_df[c].dtype) for c in train_df.columns}
+    test_schema = {str(c): str(test_df[c].dtype) for c in test_df.columns}
+    if train_schema != test_schema:
+        raise ValueError("train_df and test_df must share the same columns and dtypes")
+
+    schema_hex, content_hex = _compute_hashes([train_df, test_df], index_cols)
+
     return DatasetFingerprint(
         git_sha=get_git_sha(),
-        dataset_content_hash=content_hash(combined, index_cols=index_cols),
-        dataset_schema_hash=schema_hash(combined),
-        row_count=int(len(combined)),
+        dataset_content_hash=content_hex,
+        dataset_schema_hash=schema_hex,
+        row_count=len(train_df) + len(test_df),
         data_source_uri=data_source_uri,
+        dataset_file_hash=fingerprint_file(data_file) if data_file else None,
+        data_source_file_hash=file_content_hash(data_file) if data_file else None,
     )
 
 
-def write_fingerprint_json(fp: DatasetFingerprint, path: Path) -> None:
+def write_fingerprint_json(
+    fp: DatasetFingerprint, path: Path, *, pretty: bool = False
+) -> None:
+    """Compact by default (machine-read via `read_fingerprint_json`); `pretty` for humans."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(fp.to_json(), encoding="utf-8")
+    dumps = dumps_pretty if pretty else dumps_compact
+    path.write_bytes(dumps(fp.to_dict()))
 
 
 def read_fingerprint_json(path: Path) -> DatasetFingerprint:
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Mapping
 
 from src.common.constants import FEATURE_STATS_SCHEMA_VERSION
+from src.common.jsonio import dumps_compact, dumps_pretty, loads
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureStats:
     """Skeleton contract for feature distribution stats."""
 
@@ -17,8 +17,9 @@ class FeatureStats:
     def to_dict(self) -> dict[str, Any]:
         return {"schema_version": self.schema_version, "stats": self.stats}
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+    def to_json(self, pretty: bool = False) -> str:
+        dumps = dumps_pretty if pretty else dumps_compact
+        return dumps(self.to_dict()).decode("utf-8")
 
     @staticmethod
     def from_dict(payload: Mapping[str, Any]) -> "FeatureStats":
@@ -35,4 +36,4 @@ class FeatureStats:
 
     @staticmethod
     def from_json(payload: str) -> "FeatureStats":
-        return FeatureStats.from_dict(json.loads(payload))
+        return FeatureStats.from_dict(loads(payload))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from src.common.constants import MODEL_REF_SCHEMA_VERSION
+from src.common.jsonio import dumps_compact, dumps_pretty, loads
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelRef:
     """Reference to a model in the registry or a specific run artifact."""
 
@@ -26,8 +26,9 @@ class ModelRef:
             "source_run_id": self.source_run_id,
         }
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+    def to_json(self, pretty: bool = False) -> str:
+        dumps = dumps_pretty if pretty else dumps_compact
+        return dumps(self.to_dict()).decode("utf-8")
 
     @staticmethod
     def from_dict(payload: Mapping[str, Any]) -> "ModelRef":
@@ -58,4 +59,4 @@ class ModelRef:
 
     @staticmethod
     def from_json(payload: str) -> "ModelRef":
-        return ModelRef.from_dict(json.loads(payload))
+        return ModelRef.from_dict(loads(payload))
@@ -4,10 +4,9 @@ from pathlib import Path
 
 import matplotlib.pyplot as plt
 import mlflow
-import numpy as np
-import pandas as pd
-from sklearn.metrics import RocCurveDisplay, accuracy_score, f1_score, roc_auc_score
+from sklearn.metrics import RocCurveDisplay
 
+from src.common import pipeline_state
 from src.common.config import get_experiment_name
 from src.common.constants import (
     ART_EVALUATION_JSON,
@@ -20,34 +19,36 @@ from src.common.constants import (
     STEP_EVALUATE,
     TAG_STEP,
     TEST_CSV,
+    TEST_PARQUET,
 )
-from src.common.mlflow_utils import ensure_experiment, write_json
+from src.common.io import read_dataset
+from src.common.metrics import binary_metrics
+from src.common.mlflow_utils import set_active_experiment, write_json
 
 DATA_DIR = Path("/app/data")
 ART_DIR = Path("/app/artifacts")
 
 
 def main() -> None:
-    ensure_experiment(get_experiment_name())
-    mlflow.set_experiment(get_experiment_name())
+    set_active_experiment(get_experiment_name())
 
-    test_df = pd.read_csv(DATA_DIR / TEST_CSV)
+    test_df = read_dataset(
+        DATA_DIR / TEST_PARQUET, DATA_DIR / TEST_CSV, column_types={LABEL_COL: "int8"}
+    )
     X_test = test_df.drop(columns=[LABEL_COL])
-    y_test = test_df[LABEL_COL].astype(int)
+    # binary_metrics works on bool masks; no int64 copy of the labels needed.
+    y_test = test_df[LABEL_COL]
 
     # Orchestrator passes TRAIN_RUN_ID
-    train_run_id = (ART_DIR / ART_TRAIN_RUN_ID).read_text(encoding="utf-8").strip()
+    train_run_id = pipeline_state.get(ART_DIR / ART_TRAIN_RUN_ID)
 
     model_uri = f"runs:/{train_run_id}/{MLFLOW_ARTIFACT_PATH_MODEL}"
     model = mlflow.pyfunc.load_model(model_uri)
 
     proba = model.predict(X_test)
-    pred = (np.array(proba) >= 0.5).astype(int)
 
     metrics = {
-        "eval_accuracy": float(accuracy_score(y_test, pred)),
-        "eval_f1": float(f1_score(y_test, pred)),
-        "eval_roc_auc": float(roc_auc_score(y_test, proba)),
+        f"eval_{k}": v for k, v in binary_metrics(y_test.to_numpy(), proba).items()
     }
 
     ART_DIR.mkdir(parents=True, exist_ok=True)
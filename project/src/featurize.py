@@ -4,7 +4,6 @@ from pathlib import Path
 
 import joblib
 import mlflow
-import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
@@ -15,20 +14,22 @@ from src.common.constants import (
     LABEL_COL,
     RAW_CSV,
     TEST_CSV,
+    TEST_PARQUET,
     TRAIN_CSV,
+    TRAIN_PARQUET,
     STEP_FEATURIZE,
     TAG_MODEL_NAME,
     TAG_STEP,
 )
-from src.common.mlflow_utils import ensure_experiment
+from src.common.io import read_csv, write_csv, write_parquet
+from src.common.mlflow_utils import set_active_experiment
 
 DATA_DIR = Path("/app/data")
 ART_DIR = Path("/app/artifacts")
 
 
 def main() -> None:
-    ensure_experiment(get_experiment_name())
-    mlflow.set_experiment(get_experiment_name())
+    set_active_experiment(get_experiment_name())
     model_name = get_model_name()
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -38,12 +39,12 @@ def main() -> None:
     if not raw_path.exists():
         raise RuntimeError(f"Missing raw dataset: {raw_path}. Run ingest first.")
 
-    df = pd.read_csv(raw_path)
+    df = read_csv(raw_path)
     if LABEL_COL not in df.columns:
         raise RuntimeError(f"Expected column {LABEL_COL!r} in {RAW_CSV}")
 
     X = df.drop(columns=[LABEL_COL])
-    y = df[LABEL_COL].astype(int)
+    y = df[LABEL_COL].astype("int8")
 
     X_train, X_test, y_train, y_test = train_test_split(
         X,
@@ -61,8 +62,12 @@ def main() -> None:
 
     train_path = DATA_DIR / TRAIN_CSV
     test_path = DATA_DIR / TEST_CSV
-    train_df.to_csv(train_path, index=False)
-    test_df.to_csv(test_path, index=False)
+    write_csv(train_df, train_path)
+    write_csv(test_df, test_path)
+    # Typed columnar copies for train/evaluate; the CSVs stay as the human-readable
+    # artifacts (and the fallback when Parquet is absent).
+    write_parquet(train_df, DATA_DIR / TRAIN_PARQUET)
+    write_parquet(test_df, DATA_DIR / TEST_PARQUET)
 
     # Keep it simple + compatible with your train.py which loads this artifact.
     preprocessor = Pipeline(
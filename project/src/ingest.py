@@ -7,14 +7,14 @@ from sklearn.datasets import load_breast_cancer
 
 from src.common.config import get_experiment_name, get_model_name
 from src.common.constants import RAW_CSV, STEP_INGEST, TAG_MODEL_NAME, TAG_STEP
-from src.common.mlflow_utils import ensure_experiment
+from src.common.io import write_csv
+from src.common.mlflow_utils import set_active_experiment
 
 DATA_DIR = Path("/app/data")
 
 
 def main() -> None:
-    ensure_experiment(get_experiment_name())
-    mlflow.set_experiment(get_experiment_name())
+    set_active_experiment(get_experiment_name())
     model_name = get_model_name()
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -27,7 +27,7 @@ def main() -> None:
         df = ds.frame.copy()
 
         raw_path = DATA_DIR / RAW_CSV
-        df.to_csv(raw_path, index=False)
+        write_csv(df, raw_path)
 
         mlflow.log_params(
             {
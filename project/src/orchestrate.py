@@ -1,73 +1,85 @@
 from __future__ import annotations
 
 import subprocess
+import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Final
 
 import mlflow
 
-from src.common.config import get_experiment_name, get_tracking_uri
-from src.common.constants import ART_TRAIN_RUN_ID, STEP_TRAIN, TAG_STEP
-from src.common.mlflow_utils import ensure_experiment
+from src import evaluate, featurize, ingest, register, train
+from src.common import pipeline_state
+from src.common.config import (
+    get_experiment_name,
+    get_tracking_uri,
+    use_subprocess_steps,
+)
+from src.common.constants import (
+    ART_TRAIN_RUN_ID,
+    STEP_EVALUATE,
+    STEP_FEATURIZE,
+    STEP_INGEST,
+    STEP_REGISTER,
+    STEP_TRAIN,
+)
+from src.common.mlflow_utils import set_active_experiment
 
 ART_DIR = Path("/app/artifacts")
 
+# Steps run in this interpreter: imports, the MLflow client and its HTTP pool are
+# shared instead of being rebuilt by a fresh `python -m` per step.
+STEPS: Final[dict[str, Callable[[], None]]] = {
+    STEP_INGEST: ingest.main,
+    STEP_FEATURIZE: featurize.main,
+    STEP_TRAIN: train.main,
+    STEP_EVALUATE: evaluate.main,
+    STEP_REGISTER: register.main,
+}
+
 
 def _run_step(module: str) -> None:
     print(f"[orchestrate] Running step: {module}")
-    subprocess.check_call(["python", "-m", f"src.{module}"])
-
-
-def _latest_train_run_id(experiment_id: str) -> str:
-    """Return the most recent train run id for an experiment.
-
-    MLflow has changed the return type of `search_runs` across versions
-    (DataFrame vs. list[Run]). Handle both to keep the orchestrator stable.
-    """
-    runs = mlflow.search_runs(
-        experiment_ids=[experiment_id],
-        filter_string=f"tags.{TAG_STEP} = '{STEP_TRAIN}'",
-        order_by=["attributes.start_time DESC"],
-        max_results=1,
-    )
-
-    # MLflow <=2.x returns a pandas DataFrame.
-    if hasattr(runs, "empty") and hasattr(runs, "iloc"):
-        if runs.empty:  # type: ignore[attr-defined]
-            raise RuntimeError("No train run found after training step.")
-        return str(runs.iloc[0]["run_id"])  # type: ignore[index]
-
-    # MLflow 3.x can return list[Run].
-    if isinstance(runs, list):
-        if not runs:
-            raise RuntimeError("No train run found after training step.")
-        run0 = runs[0]
-        run_id = getattr(getattr(run0, "info", None), "run_id", None)
-        if not run_id:
-            raise RuntimeError("Train run object missing run_id.")
-        return str(run_id)
-
-    raise TypeError(f"Unexpected mlflow.search_runs return type: {type(runs)}")
+    if use_subprocess_steps():
+        # Same interpreter (no PATH lookup); -s skips user site-packages, -B skips
+        # .pyc writes. Not -I: isolated mode drops cwd from sys.path, hiding `src`.
+        subprocess.check_call([sys.executable, "-s", "-B", "-m", f"src.{module}"])
+        return
+
+    start = time.perf_counter()
+    try:
+        STEPS[module]()
+    except BaseException:
+        # A step that failed mid-run must not leak its active run into the next
+        # one, nor leave it looking FINISHED in the tracking UI.
+        if mlflow.active_run() is not None:
+            mlflow.end_run(status="FAILED")
+        raise
+    else:
+        if mlflow.active_run() is not None:
+            mlflow.end_run()
+    finally:
+        print(f"[orchestrate] step={module} took {time.perf_counter() - start:.2f}s")
 
 
 def main() -> None:
     mlflow.set_tracking_uri(get_tracking_uri())
-    ensure_experiment(get_experiment_name())
-    mlflow.set_experiment(get_experiment_name())
+    set_active_experiment(get_experiment_name())
     ART_DIR.mkdir(parents=True, exist_ok=True)
+    # In-process steps hand small values over in memory; subprocesses need files.
+    pipeline_state.use_in_memory(not use_subprocess_steps())
 
-    _run_step("ingest")
-    _run_step("featurize")
-    _run_step("train")
-
-    exp = mlflow.get_experiment_by_name(get_experiment_name())
-    assert exp is not None
+    _run_step(STEP_INGEST)
+    _run_step(STEP_FEATURIZE)
+    _run_step(STEP_TRAIN)
 
-    train_run_id = _latest_train_run_id(exp.experiment_id)
-    (ART_DIR / ART_TRAIN_RUN_ID).write_text(str(train_run_id), encoding="utf-8")
+    # train records its own run id; no search_runs round-trip needed.
+    train_run_id = pipeline_state.get(ART_DIR / ART_TRAIN_RUN_ID)
     print(f"[orchestrate] Captured {ART_TRAIN_RUN_ID}={train_run_id}")
 
-    _run_step("evaluate")
-    _run_step("register")
+    _run_step(STEP_EVALUATE)
+    _run_step(STEP_REGISTER)
 
     print("[orchestrate] Pipeline complete.")
 
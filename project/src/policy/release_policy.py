@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any
 
 from mlflow.exceptions import MlflowException
 from mlflow.tracking import MlflowClient
@@ -26,8 +28,19 @@ _REQUIRED_TAGS: tuple[str, ...] = (
     TAG_TRAINING_RUN_ID,
 )
 
+# Every candidate tag the policy reads; also echoed into the context for debugging.
+_SUBSET_KEYS: tuple[str, ...] = (
+    TAG_GATE,
+    TAG_RELEASE_STATUS,
+    TAG_SOURCE_RUN_ID,
+    TAG_DATASET_FINGERPRINT,
+    TAG_GIT_SHA,
+    TAG_CONFIG_HASH,
+    TAG_TRAINING_RUN_ID,
+)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Violation:
     """A single policy violation or warning."""
 
@@ -35,8 +48,11 @@ class Violation:
     message: str
     details: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"code": self.code, "message": self.message, "details": self.details}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyDecision:
     """Structured policy outcome for promotion gating.
 
@@ -52,17 +68,12 @@ class PolicyDecision:
     def to_dict(self) -> dict[str, Any]:
         return {
             "allowed": self.allowed,
-            "errors": [v.__dict__ for v in self.errors],
-            "warnings": [v.__dict__ for v in self.warnings],
+            "errors": [v.to_dict() for v in self.errors],
+            "warnings": [v.to_dict() for v in self.warnings],
             "context": self.context,
         }
 
 
-def _missing_required_tags(tags: Mapping[str, str] | None) -> list[str]:
-    safe_tags = tags or {}
-    return [k for k in _REQUIRED_TAGS if not str(safe_tags.get(k, "")).strip()]
-
-
 def _try_get_alias_version(
     client: MlflowClient, model_name: str, alias: str
 ) -> str | None:
@@ -73,6 +84,13 @@ def _try_get_alias_version(
     return str(mv.version)
 
 
+def _gather(**calls: Callable[[], Any]) -> dict[str, Any]:
+    """Run independent (I/O-bound) calls concurrently; return results by name."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in calls.items()}
+    return {name: f.result() for name, f in futures.items()}
+
+
 def evaluate_promotion_policy(
     client: MlflowClient,
     model_name: str,
@@ -88,8 +106,13 @@ def evaluate_promotion_policy(
     errors: list[Violation] = []
     warnings: list[Violation] = []
 
-    candidate_version = _try_get_alias_version(client, model_name, from_alias)
-    current_prod_version = _try_get_alias_version(client, model_name, to_alias)
+    # Both alias lookups are independent registry round-trips: overlap them.
+    aliases = _gather(
+        cand=lambda: _try_get_alias_version(client, model_name, from_alias),
+        prod=lambda: _try_get_alias_version(client, model_name, to_alias),
+    )
+    candidate_version = aliases["cand"]
+    current_prod_version = aliases["prod"]
 
     context: dict[str, Any] = {
         "model_name": model_name,
@@ -117,20 +140,14 @@ def evaluate_promotion_policy(
     # Load candidate model version
     candidate = client.get_model_version(model_name, candidate_version)
     candidate_tags = candidate.tags or {}
+    # Normalize once: MLflow tag values are str; `or ""` covers missing keys.
+    norm = {k: (candidate_tags.get(k) or "").strip() for k in _SUBSET_KEYS}
 
     # Helpful context for debugging
-    context["candidate_tags_subset"] = {
-        TAG_GATE: candidate_tags.get(TAG_GATE, ""),
-        TAG_RELEASE_STATUS: candidate_tags.get(TAG_RELEASE_STATUS, ""),
-        TAG_SOURCE_RUN_ID: candidate_tags.get(TAG_SOURCE_RUN_ID, ""),
-        TAG_DATASET_FINGERPRINT: candidate_tags.get(TAG_DATASET_FINGERPRINT, ""),
-        TAG_GIT_SHA: candidate_tags.get(TAG_GIT_SHA, ""),
-        TAG_CONFIG_HASH: candidate_tags.get(TAG_CONFIG_HASH, ""),
-        TAG_TRAINING_RUN_ID: candidate_tags.get(TAG_TRAINING_RUN_ID, ""),
-    }
+    context["candidate_tags_subset"] = norm
 
     # Policy: must have required metadata tags
-    missing = _missing_required_tags(candidate_tags)
+    missing = [k for k in _REQUIRED_TAGS if not norm[k]]
     if missing:
         errors.append(
             Violation(
@@ -141,7 +158,7 @@ def evaluate_promotion_policy(
         )
 
     # Policy: gate must be passed
-    gate_val = str(candidate_tags.get(TAG_GATE, "")).strip()
+    gate_val = norm[TAG_GATE]
     if gate_val != GATE_PASSED:
         errors.append(
             Violation(
@@ -152,7 +169,7 @@ def evaluate_promotion_policy(
         )
 
     # Policy: release_status must match the from_alias (candidate)
-    rs_val = str(candidate_tags.get(TAG_RELEASE_STATUS, "")).strip()
+    rs_val = norm[TAG_RELEASE_STATUS]
     if rs_val != from_alias:
         errors.append(
             Violation(
@@ -178,7 +195,8 @@ def evaluate_promotion_policy(
         )
 
     # Warnings (non-blocking) — auditability / traceability
-    if not str(candidate_tags.get(TAG_SOURCE_RUN_ID, "")).strip():
+    run_id = norm[TAG_SOURCE_RUN_ID]
+    if not run_id:
         warnings.append(
             Violation(
                 code="MISSING_SOURCE_RUN_ID",
@@ -188,7 +206,6 @@ def evaluate_promotion_policy(
         )
     else:
         # Optional: validate the run exists (auditability)
-        run_id = str(candidate_tags.get(TAG_SOURCE_RUN_ID, "")).strip()
         try:
             client.get_run(run_id)
         except Exception:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.tracking import MlflowClient
 
@@ -18,6 +18,8 @@ from src.common.constants import (
     TAG_PROMOTED_FROM_ALIAS,
     TAG_RELEASE_STATUS,
 )
+from src.common.jsonio import dumps_pretty
+from src.common.mlflow_utils import get_client, set_model_version_tags
 from src.policy.release_policy import PolicyDecision, evaluate_promotion_policy
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,11 @@ logger = logging.getLogger(__name__)
 
 def _print_decision(decision: PolicyDecision, fmt: str) -> None:
     if fmt == "json":
-        print(json.dumps(decision.to_dict(), indent=2, sort_keys=True))
+        # Through to_dict(): OPT_SORT_KEYS sorts dict keys but not dataclass
+        # fields. Bytes go straight to stdout without a str round trip.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dumps_pretty(decision.to_dict()) + b"\n")
+        sys.stdout.buffer.flush()
         return
 
     # text format
@@ -46,38 +52,37 @@ def _try_get_prod_version(client: MlflowClient, model_name: str) -> str | None:
 
 
 def apply_promotion(
-    client: MlflowClient, model_name: str, candidate_version: str, from_alias: str
+    client: MlflowClient,
+    model_name: str,
+    candidate_version: str,
+    from_alias: str,
+    prev_prod_version: str | None = None,
 ) -> None:
-    """Apply promotion side effects. Call only after policy allows it."""
-    prev_prod_version = _try_get_prod_version(client, model_name)
-
-    # 1) Set aliases
-    client.set_registered_model_alias(model_name, ALIAS_PROD, candidate_version)
-    client.set_registered_model_alias(model_name, ALIAS_CHAMPION, candidate_version)
-
-    # 2) Promotion evidence tags on the new prod version
-    client.set_model_version_tag(
-        name=model_name,
-        version=candidate_version,
-        key=TAG_RELEASE_STATUS,
-        value=ALIAS_PROD,
-    )
-    client.set_model_version_tag(
-        name=model_name,
-        version=candidate_version,
-        key=TAG_PROMOTED_FROM_ALIAS,
-        value=from_alias,
-    )
+    """Apply promotion side effects. Call only after policy allows it.
+
+    `prev_prod_version` is the version currently behind the prod alias, which
+    this call moves to `candidate_version`.
+    """
+
+    # 1) Set aliases (independent calls: issue both at once)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(
+            pool.map(
+                lambda alias: client.set_registered_model_alias(
+                    model_name, alias, candidate_version
+                ),
+                (ALIAS_PROD, ALIAS_CHAMPION),
+            )
+        )
 
-    # 3) Persist previous prod version for deterministic rollback
+    # 2) Promotion evidence tags on the new prod version, plus
+    # 3) the previous prod version for deterministic rollback
+    tags = {TAG_RELEASE_STATUS: ALIAS_PROD, TAG_PROMOTED_FROM_ALIAS: from_alias}
     if prev_prod_version is not None:
-        client.set_model_version_tag(
-            name=model_name,
-            version=candidate_version,
-            key=TAG_PREVIOUS_PROD_VERSION,
-            value=prev_prod_version,
-        )
+        tags[TAG_PREVIOUS_PROD_VERSION] = prev_prod_version
+    set_model_version_tags(client, model_name, candidate_version, tags)
 
+    if prev_prod_version is not None:
         # Optional: mark old prod release_status as previous_prod (nice audit trail)
         try:
             client.set_model_version_tag(
@@ -124,7 +129,7 @@ def main(argv: list[str] | None = None) -> None:
 
     args = parse_args(sys.argv[1:] if argv is None else argv)
 
-    client = MlflowClient()
+    client = get_client()
     decision = evaluate_promotion_policy(
         client=client,
         model_name=args.model_name,
@@ -143,11 +148,19 @@ def main(argv: list[str] | None = None) -> None:
         raise SystemExit(2)
 
     candidate_version = str(decision.context["candidate_version"])
+    # The policy resolved the version behind --to-alias; apply_promotion always
+    # moves prod, so its lookup is reused only when the two are the same alias.
+    prev_prod_version = (
+        decision.context.get("current_prod_version")
+        if args.to_alias == ALIAS_PROD
+        else _try_get_prod_version(client, args.model_name)
+    )
     apply_promotion(
         client=client,
         model_name=args.model_name,
         candidate_version=candidate_version,
         from_alias=args.from_alias,
+        prev_prod_version=prev_prod_version,
     )
 
 
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import Final
 
-import mlflow
-from mlflow.tracking import MlflowClient
-
+from src.common import pipeline_state
 from src.common.config import get_experiment_name, get_model_name
 from src.common.constants import (
     ALIAS_CANDIDATE,
@@ -17,8 +16,10 @@ from src.common.constants import (
     MLFLOW_ARTIFACT_PATH_MODEL,
     TAG_CONFIG_HASH,
     TAG_DATASET_CONTENT_HASH,
+    TAG_DATASET_FILE_HASH,
     TAG_DATASET_FINGERPRINT,
     TAG_DATASET_SCHEMA_HASH,
+    TAG_DATA_SOURCE_FILE_HASH,
     TAG_DATA_SOURCE_URI,
     TAG_GATE,
     TAG_GIT_SHA,
@@ -27,7 +28,6 @@ from src.common.constants import (
     TAG_SOURCE_RUN_ID,
     TAG_TRAINING_RUN_ID,
 )
-from src.common.mlflow_utils import ensure_experiment
 
 logger = logging.getLogger(__name__)
 
@@ -37,33 +37,43 @@ FINGERPRINT_TAG_KEYS: Final[tuple[str, ...]] = (
     TAG_GIT_SHA,
     TAG_DATASET_CONTENT_HASH,
     TAG_DATASET_SCHEMA_HASH,
+    TAG_DATASET_FILE_HASH,
     TAG_DATASET_FINGERPRINT,
     TAG_ROW_COUNT,
     TAG_DATA_SOURCE_URI,
+    TAG_DATA_SOURCE_FILE_HASH,
     TAG_CONFIG_HASH,
     TAG_TRAINING_RUN_ID,
 )
 
 
+def _read_small(path: Path) -> str:
+    """Read a tiny ASCII marker file (run id, gate flag) with a single read()."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 256).decode("ascii").strip()
+    finally:
+        os.close(fd)
+
+
 def _read_required_artifact_text(path: Path, artifact_name: str) -> str:
-    if not path.exists():
-        raise RuntimeError(f"{artifact_name} artifact not found at {path}.")
-    return path.read_text(encoding="utf-8").strip()
+    try:
+        return _read_small(path)
+    except FileNotFoundError:
+        raise RuntimeError(f"{artifact_name} artifact not found at {path}.") from None
 
 
 def main() -> None:
     logging.basicConfig(level="INFO")
 
-    experiment_name = get_experiment_name()
-    ensure_experiment(experiment_name)
-    mlflow.set_experiment(experiment_name)
-
     model_name = get_model_name()
-    client = MlflowClient()
 
-    train_run_id = _read_required_artifact_text(
-        ART_DIR / ART_TRAIN_RUN_ID, ART_TRAIN_RUN_ID
-    )
+    try:
+        train_run_id = pipeline_state.get(ART_DIR / ART_TRAIN_RUN_ID)
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"{ART_TRAIN_RUN_ID} artifact not found at {ART_DIR / ART_TRAIN_RUN_ID}."
+        ) from None
     gate_ok_raw = _read_required_artifact_text(ART_DIR / ART_GATE_OK, ART_GATE_OK)
     gate_ok = gate_ok_raw.lower() == "true"
 
@@ -74,25 +84,29 @@ def main() -> None:
         logger.info("Gate failed. Not registering model.")
         return
 
-    run = client.get_run(train_run_id)
-    run_tags = run.data.tags or {}
+    # Importing mlflow costs 1-2s cold; only pay it when we actually register.
+    import mlflow
 
-    mv = mlflow.register_model(model_uri=model_uri, name=model_name)
+    from src.common.mlflow_utils import get_client, set_active_experiment
 
-    # Minimum traceability for the model version.
-    client.set_model_version_tag(
-        model_name, mv.version, TAG_SOURCE_RUN_ID, train_run_id
-    )
-    client.set_model_version_tag(model_name, mv.version, TAG_GATE, GATE_PASSED)
-    client.set_model_version_tag(
-        model_name, mv.version, TAG_RELEASE_STATUS, ALIAS_CANDIDATE
-    )
+    set_active_experiment(get_experiment_name())
+    client = get_client()
+
+    run = client.get_run(train_run_id)
+    run_tags = run.data.tags or {}
 
-    # Copy fingerprint/config tags from the training run onto the model version.
-    for key in FINGERPRINT_TAG_KEYS:
-        value = str(run_tags.get(key, "")).strip()
-        if value:
-            client.set_model_version_tag(model_name, mv.version, key, value)
+    # Fingerprint/config tags copied from the training run, plus minimum traceability.
+    mv_tags = {
+        key: value
+        for key in FINGERPRINT_TAG_KEYS
+        if (value := str(run_tags.get(key, "")).strip())
+    }
+    mv_tags[TAG_SOURCE_RUN_ID] = train_run_id
+    mv_tags[TAG_GATE] = GATE_PASSED
+    mv_tags[TAG_RELEASE_STATUS] = ALIAS_CANDIDATE
+
+    # Tags ride along in the create-model-version request: one RPC, no per-tag calls.
+    mv = mlflow.register_model(model_uri=model_uri, name=model_name, tags=mv_tags)
 
     client.set_registered_model_alias(
         name=model_name, alias=ALIAS_CANDIDATE, version=mv.version
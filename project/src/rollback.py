@@ -5,7 +5,9 @@ import os
 
 from mlflow.tracking import MlflowClient
 
+from src.common.config import get_model_name
 from src.common.constants import ALIAS_PROD, TAG_PREVIOUS_PROD_VERSION
+from src.common.mlflow_utils import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -48,13 +50,9 @@ def rollback_prod(client: MlflowClient, model_name: str) -> None:
     )
 
 
-def get_model_name() -> str:
-    return os.environ.get("MODEL_NAME", "breast_cancer_clf")
-
-
 def main() -> None:
     logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
-    rollback_prod(MlflowClient(), get_model_name())
+    rollback_prod(get_client(), get_model_name())
 
 
 if __name__ == "__main__":
@@ -3,25 +3,29 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Final
 
 import joblib
 import mlflow
-import pandas as pd
+import numpy as np
 from mlflow.models.signature import infer_signature
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
 from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
 
+from src.common import pipeline_state
 from src.common.config import get_experiment_name, get_model_name
 from src.common.constants import (
     ART_DATASET_FINGERPRINT_JSON,
     ART_PREPROCESSOR,
+    ART_TRAIN_RUN_ID,
     ART_TRAIN_SUMMARY_JSON,
     LABEL_COL,
     MLFLOW_ARTIFACT_PATH_MODEL,
     MLFLOW_ARTIFACT_PATH_REPORTS,
+    RAW_CSV,
     STEP_TRAIN,
     TAG_CONFIG_HASH,
     TAG_DATASET_FINGERPRINT,
@@ -29,9 +33,14 @@ from src.common.constants import (
     TAG_STEP,
     TAG_TRAINING_RUN_ID,
     TEST_CSV,
+    TEST_PARQUET,
     TRAIN_CSV,
+    TRAIN_PARQUET,
 )
-from src.common.mlflow_utils import ensure_experiment
+from src.common.io import read_dataset
+from src.common.jsonio import dumps_compact
+from src.common.metrics import binary_metrics
+from src.common.mlflow_utils import get_client, set_active_experiment, write_json
 from src.contracts.dataset_fingerprint import (
     compute_fingerprint,
     write_fingerprint_json,
@@ -42,39 +51,53 @@ logger = logging.getLogger(__name__)
 DATA_DIR: Final[Path] = Path("/app/data")
 ART_DIR: Final[Path] = Path("/app/artifacts")
 
+# liblinear (coordinate descent) wins on small dense problems; saga scales past it.
+LIBLINEAR_MAX_SAMPLES: Final[int] = 10_000
 
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
 def main() -> None:
     logging.basicConfig(level="INFO")
 
-    experiment_name = get_experiment_name()
-    ensure_experiment(experiment_name)
-    mlflow.set_experiment(experiment_name)
+    set_active_experiment(get_experiment_name())
 
     model_name = get_model_name()
 
-    train_df = pd.read_csv(DATA_DIR / TRAIN_CSV)
-    test_df = pd.read_csv(DATA_DIR / TEST_CSV)
+    # featurize stores the label as int8 in Parquet; the CSV fallback parses it the
+    # same way so the fingerprint does not depend on which copy was read.
+    label_types = {LABEL_COL: "int8"}
+    train_df = read_dataset(
+        DATA_DIR / TRAIN_PARQUET, DATA_DIR / TRAIN_CSV, column_types=label_types
+    )
+    test_df = read_dataset(
+        DATA_DIR / TEST_PARQUET, DATA_DIR / TEST_CSV, column_types=label_types
+    )
 
     X_train = train_df.drop(columns=[LABEL_COL])
-    y_train = train_df[LABEL_COL].astype(int)
+    y_train = train_df[LABEL_COL]
 
     X_test = test_df.drop(columns=[LABEL_COL])
-    y_test = test_df[LABEL_COL].astype(int)
+    y_test = test_df[LABEL_COL]
 
     preprocessor = joblib.load(ART_DIR / ART_PREPROCESSOR)
 
+    solver = "liblinear" if len(X_train) < LIBLINEAR_MAX_SAMPLES else "saga"
     clf = LogisticRegression(
         max_iter=2000,
-        solver="lbfgs",
+        solver=solver,
+        tol=1e-4,
         class_weight="balanced",
         random_state=42,
     )
 
-    pipeline = Pipeline(steps=[("pre", preprocessor), ("clf", clf)])
+    # float32 halves the memory traffic of the solver's dense passes.
+    to_float32 = FunctionTransformer(np.asarray, kw_args={"dtype": np.float32})
+    pipeline = Pipeline(
+        steps=[("pre", preprocessor), ("f32", to_float32), ("clf", clf)]
+    )
 
     # Used for traceability + reproducibility. In production, this becomes gs:// or bq://.
     data_source_uri = f"file://{DATA_DIR.as_posix()}"
@@ -82,12 +105,22 @@ def main() -> None:
     params = {
         "model_type": "logreg",
         "max_iter": 2000,
-        "solver": "lbfgs",
+        "solver": solver,
+        "tol": 1e-4,
+        "dtype": "float32",
         "class_weight": "balanced",
         "random_state": 42,
     }
 
-    with mlflow.start_run(run_name="train") as run:
+    # Report uploads overlap with fit/log_model; the pool joins before the run ends.
+    with (
+        mlflow.start_run(run_name="train") as run,
+        ThreadPoolExecutor(max_workers=2) as uploads,
+    ):
+        client = get_client()
+        run_id = run.info.run_id
+        pending = []
+
         mlflow.set_tag(TAG_STEP, STEP_TRAIN)
         mlflow.set_tag(TAG_MODEL_NAME, model_name)
 
@@ -99,40 +132,47 @@ def main() -> None:
             test_df=test_df,
             data_source_uri=data_source_uri,
             index_cols=None,
+            data_file=DATA_DIR / RAW_CSV,
         )
         mlflow.set_tags(fp.as_tags())
 
         fp_path = ART_DIR / ART_DATASET_FINGERPRINT_JSON
         write_fingerprint_json(fp, fp_path)
-        mlflow.log_artifact(str(fp_path), artifact_path=MLFLOW_ARTIFACT_PATH_REPORTS)
+        pending.append(
+            uploads.submit(
+                client.log_artifact,
+                run_id,
+                str(fp_path),
+                MLFLOW_ARTIFACT_PATH_REPORTS,
+            )
+        )
 
         mlflow.log_params(params)
 
         # Deterministic config hash is a promotion guardrail.
-        config_hash = _sha256_text(
-            json.dumps(params, sort_keys=True, separators=(",", ":"))
+        config_hash = _sha256_bytes(
+            json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8")
         )
         mlflow.set_tag(TAG_CONFIG_HASH, config_hash)
 
         # One stable dataset fingerprint hash (in addition to component tags).
-        mlflow.set_tag(TAG_DATASET_FINGERPRINT, _sha256_text(fp.to_json()))
+        # Same bytes as fp.to_json(), without the str round-trip.
+        mlflow.set_tag(
+            TAG_DATASET_FINGERPRINT, _sha256_bytes(dumps_compact(fp.to_dict()))
+        )
 
         pipeline.fit(X_train, y_train)
 
         proba = pipeline.predict_proba(X_test)[:, 1]
-        pred = (proba >= 0.5).astype(int)
 
         metrics = {
-            "test_accuracy": float(accuracy_score(y_test, pred)),
-            "test_f1": float(f1_score(y_test, pred)),
-            "test_roc_auc": float(roc_auc_score(y_test, proba)),
+            f"test_{k}": v for k, v in binary_metrics(y_test.to_numpy(), proba).items()
         }
         mlflow.log_metrics(metrics)
 
+        # The example is the head of X_test, so its scores are already in proba.
         input_example = X_test.head(5)
-        signature = infer_signature(
-            input_example, pipeline.predict_proba(input_example)[:, 1]
-        )
+        signature = infer_signature(input_example, proba[:5])
 
         mlflow.sklearn.log_model(
             sk_model=pipeline,
@@ -143,12 +183,20 @@ def main() -> None:
         )
 
         summary_path = ART_DIR / ART_TRAIN_SUMMARY_JSON
-        summary_path.write_text(
-            json.dumps(metrics, indent=2, sort_keys=True), encoding="utf-8"
-        )
-        mlflow.log_artifact(
-            str(summary_path), artifact_path=MLFLOW_ARTIFACT_PATH_REPORTS
+        write_json(summary_path, metrics)
+        pending.append(
+            uploads.submit(
+                client.log_artifact,
+                run_id,
+                str(summary_path),
+                MLFLOW_ARTIFACT_PATH_REPORTS,
+            )
         )
+        for upload in pending:
+            upload.result()
+
+        # Hand the run id to evaluate/register directly (read by orchestrate too).
+        pipeline_state.put(ART_DIR / ART_TRAIN_RUN_ID, run.info.run_id)
 
         logger.info("run_id=%s", run.info.run_id)
         logger.info("dataset_fingerprint=%s", fp_path)
@@ -12,6 +12,17 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.common.config import clear_config_cache  # noqa: E402
+from src.common.mlflow_utils import reset_client  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config():
+    """Config getters are lru_cached; make env changes visible per test."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
 
 @pytest.fixture()
 def mlflow_sqlite(tmp_path: Path):
@@ -30,5 +41,8 @@ def mlflow_sqlite(tmp_path: Path):
     mlflow.set_registry_uri(uri)
 
     os.environ["MLFLOW_TRACKING_URI"] = uri
+    reset_client()
 
     yield uri
+
+    reset_client()
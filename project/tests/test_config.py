@@ -11,3 +11,17 @@ def test_get_experiment_name_default() -> None:
 def test_get_model_name_default() -> None:
     assert isinstance(get_model_name(), str)
     assert get_model_name() != ""
+
+
+def test_clear_config_cache_picks_up_env_changes(monkeypatch) -> None:
+    from src.common.config import clear_config_cache
+
+    monkeypatch.setenv("MODEL_NAME", "first")
+    clear_config_cache()
+    assert get_model_name() == "first"
+
+    monkeypatch.setenv("MODEL_NAME", "second")
+    assert get_model_name() == "first"
+    clear_config_cache()
+    assert get_model_name() == "second"
+    clear_config_cache()
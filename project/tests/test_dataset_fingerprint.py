@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import src.common.dataset_fingerprint as shim
+import src.contracts.dataset_fingerprint as fp_mod
+from src.common.config import is_prod_mode
+from src.contracts.dataset_fingerprint import (
+    DatasetFingerprint,
+    compute_fingerprint,
+    content_hash,
+    file_content_hash,
+    fingerprint_file,
+    schema_hash,
+)
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "b": [1.5, 2.5, 3.5],
+            "a": [1, 2, 3],
+            "label": ["x", "y", "z"],
+        }
+    )
+
+
+def test_content_hash_is_deterministic() -> None:
+    assert content_hash(_frame()) == content_hash(_frame())
+
+
+def test_content_hash_ignores_column_order() -> None:
+    df = _frame()
+    assert content_hash(df) == content_hash(df[["label", "a", "b"]])
+
+
+def test_content_hash_detects_value_change() -> None:
+    df = _frame()
+    changed = df.copy()
+    changed.loc[1, "b"] = 2.75
+    assert content_hash(df) != content_hash(changed)
+
+
+def test_content_hash_detects_dtype_change() -> None:
+    df = _frame()
+    assert content_hash(df) != content_hash(df.astype({"a": "int32"}))
+
+
+def test_compute_fingerprint_counts_rows_across_splits() -> None:
+    df = _frame()
+    fp = compute_fingerprint(
+        train_df=df.iloc[:2], test_df=df.iloc[2:], data_source_uri="file:///tmp"
+    )
+    assert fp.row_count == 3
+    assert (
+        fp.dataset_content_hash
+        == compute_fingerprint(
+            train_df=df.iloc[:2], test_df=df.iloc[2:], data_source_uri="file:///tmp"
+        ).dataset_content_hash
+    )
+
+
+def test_compute_fingerprint_rejects_mismatched_schemas() -> None:
+    df = _frame()
+    with pytest.raises(ValueError):
+        compute_fingerprint(
+            train_df=df, test_df=df.drop(columns=["b"]), data_source_uri="x"
+        )
+
+
+def test_content_hash_parallel_path_matches_sequential(monkeypatch) -> None:
+    df = pd.DataFrame({f"c{i}": [float(i), i + 0.5] for i in range(8)})
+    sequential = content_hash(df)
+    monkeypatch.setattr(fp_mod, "PARALLEL_HASH_MIN_COLUMNS", 1)
+    assert content_hash(df) == sequential
+
+
+def test_fingerprint_file_hashes_raw_bytes(tmp_path: Path) -> None:
+    a = tmp_path / "a.csv"
+    b = tmp_path / "b.csv"
+    empty = tmp_path / "empty.csv"
+    a.write_bytes(b"x,y\n1,2\n")
+    b.write_bytes(b"x,y\n1,3\n")
+    empty.write_bytes(b"")
+
+    assert fingerprint_file(a) == fingerprint_file(a)
+    assert fingerprint_file(a) != fingerprint_file(b)
+    assert fingerprint_file(empty) != fingerprint_file(a)
+
+
+def test_dataset_file_hash_round_trips_and_tags(tmp_path: Path) -> None:
+    raw = tmp_path / "raw.csv"
+    raw.write_bytes(b"a\n1\n")
+    df = _frame()
+    fp = compute_fingerprint(
+        train_df=df, test_df=df, data_source_uri="x", data_file=raw
+    )
+
+    assert fp.dataset_file_hash == fingerprint_file(raw)
+    assert fp.as_tags()["dataset_file_hash"] == fp.dataset_file_hash
+    assert fp.data_source_file_hash == hashlib.sha256(b"a\n1\n").hexdigest()
+    assert file_content_hash(raw) == fp.data_source_file_hash
+    assert DatasetFingerprint.from_json(fp.to_json()) == fp
+    assert DatasetFingerprint.from_json(fp.to_json(pretty=True)) == fp
+
+
+def test_content_hash_index_cols_makes_row_order_irrelevant() -> None:
+    df = _frame()
+    shuffled = df.iloc[[2, 0, 1]]
+    assert content_hash(df, index_cols=["a"]) == content_hash(
+        shuffled, index_cols=["a"]
+    )
+    assert content_hash(df, index_cols=["label"]) == content_hash(
+        shuffled, index_cols=["label"]
+    )
+
+
+def test_common_shim_reexports_canonical_contract() -> None:
+    assert shim.DatasetFingerprint is fp_mod.DatasetFingerprint
+    assert shim.get_git_sha is fp_mod.get_git_sha
+
+
+def test_compute_fingerprint_schema_hash_matches_schema_hash() -> None:
+    df = _frame()
+    fp = compute_fingerprint(train_df=df, test_df=df, data_source_uri="x")
+    assert fp.dataset_schema_hash == schema_hash(df)
+    assert fp.dataset_content_hash != content_hash(df)
+
+
+def test_compute_fingerprint_matches_hash_of_concatenation() -> None:
+    df = _frame()
+    train, test = df.iloc[:2], df.iloc[2:]
+    fp = compute_fingerprint(train_df=train, test_df=test, data_source_uri="x")
+    assert fp.dataset_content_hash == content_hash(pd.concat([train, test]))
+
+
+def test_compute_fingerprint_sorts_index_cols_within_each_split() -> None:
+    df = _frame()
+    train, test = df.iloc[[2, 0]], df.iloc[[1]]
+    fp = compute_fingerprint(
+        train_df=train, test_df=test, data_source_uri="x", index_cols=["a"]
+    )
+    per_split = pd.concat([train.sort_values("a"), test.sort_values("a")])
+    assert fp.dataset_content_hash == content_hash(per_split)
+    assert fp.dataset_content_hash != content_hash(
+        pd.concat([train, test]), index_cols=["a"]
+    )
+
+    # Split membership is part of the fingerprint: same rows, different split.
+    moved = compute_fingerprint(
+        train_df=df.iloc[[0, 1]],
+        test_df=df.iloc[[2]],
+        data_source_uri="x",
+        index_cols=["a"],
+    )
+    assert moved.dataset_content_hash != fp.dataset_content_hash
+
+
+def test_get_git_sha_skips_git_in_prod_mode(monkeypatch) -> None:
+    def _no_fork(*args, **kwargs):
+        raise AssertionError("git must not be called in PROD_MODE")
+
+    monkeypatch.delenv("GIT_SHA", raising=False)
+    monkeypatch.setenv("PROD_MODE", "1")
+    monkeypatch.setattr(fp_mod.subprocess, "check_output", _no_fork)
+    is_prod_mode.cache_clear()
+    fp_mod.get_git_sha.cache_clear()
+    try:
+        assert fp_mod.get_git_sha() == "unknown"
+    finally:
+        is_prod_mode.cache_clear()
+        fp_mod.get_git_sha.cache_clear()
+
+
+def test_content_hash_string_columns() -> None:
+    base = pd.DataFrame({"s": ["ab", "c", None]})
+    assert content_hash(base) == content_hash(base.copy())
+    # Same bytes, different row boundaries.
+    assert content_hash(base) != content_hash(pd.DataFrame({"s": ["a", "bc", None]}))
+    assert content_hash(base) != content_hash(pd.DataFrame({"s": ["ab", "c", ""]}))
+
+
+def test_content_hash_mixed_object_column_falls_back() -> None:
+    mixed = pd.DataFrame({"s": ["a", 1, 2.5]})
+    assert content_hash(mixed) == content_hash(mixed.copy())
+    assert content_hash(mixed) != content_hash(pd.DataFrame({"s": ["a", 1, 3.5]}))
+
+
+def test_content_hash_does_not_mutate_input() -> None:
+    df = _frame().iloc[[2, 0, 1]][["label", "b", "a"]]
+    before = df.copy(deep=True)
+
+    content_hash(df, index_cols=["a"])
+    compute_fingerprint(train_df=df, test_df=df, data_source_uri="x", index_cols=["b"])
+
+    pd.testing.assert_frame_equal(df, before)
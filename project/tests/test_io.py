@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pandas.testing as pdt
+
+from src.common.io import read_csv, read_dataset, write_csv, write_parquet
+
+
+def test_csv_round_trip(tmp_path: Path) -> None:
+    df = pd.DataFrame({"mean radius": [1.5, 2.25], "target": [0, 1]})
+    path = tmp_path / "data.csv"
+
+    write_csv(df, path)
+
+    pdt.assert_frame_equal(read_csv(path), df)
+
+
+def test_read_dataset_prefers_parquet(tmp_path: Path) -> None:
+    df = pd.DataFrame({"x": [1.5, 2.5], "target": [1, 0]})
+    csv_path = tmp_path / "test.csv"
+    parquet_path = tmp_path / "test.parquet"
+    write_csv(df, csv_path)
+
+    pdt.assert_frame_equal(read_dataset(parquet_path, csv_path), df)
+
+    write_parquet(df.iloc[:1], parquet_path)
+    pdt.assert_frame_equal(read_dataset(parquet_path, csv_path), df.iloc[:1])
+
+
+def test_read_csv_applies_column_types_and_projection(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    write_csv(pd.DataFrame({"x": [1.5, 2.5], "y": [3.5, 4.5], "target": [0, 1]}), path)
+
+    df = read_csv(path, column_types={"target": "int8"}, columns=["x", "target"])
+
+    assert list(df.columns) == ["x", "target"]
+    assert df["target"].dtype == "int8"
+
+
+def test_read_dataset_csv_fallback_matches_parquet_dtypes(tmp_path: Path) -> None:
+    df = pd.DataFrame({"x": [1.5, 2.5], "target": pd.Series([1, 0], dtype="int8")})
+    csv_path = tmp_path / "train.csv"
+    parquet_path = tmp_path / "train.parquet"
+    write_csv(df, csv_path)
+    write_parquet(df, parquet_path)
+    types = {"target": "int8"}
+
+    from_csv = read_dataset(tmp_path / "missing.parquet", csv_path, column_types=types)
+    pdt.assert_frame_equal(from_csv, read_dataset(parquet_path, csv_path))
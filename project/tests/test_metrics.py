@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+from src.common.metrics import binary_metrics
+
+
+def test_binary_metrics_match_sklearn() -> None:
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, size=200)
+    proba = np.clip(y * 0.3 + rng.random(200) * 0.7, 0.0, 1.0)
+    pred = (proba >= 0.5).astype(int)
+
+    m = binary_metrics(y, proba)
+
+    assert m["accuracy"] == pytest.approx(accuracy_score(y, pred))
+    assert m["f1"] == pytest.approx(f1_score(y, pred))
+    assert m["roc_auc"] == pytest.approx(roc_auc_score(y, proba))
+
+
+def test_binary_metrics_f1_is_zero_without_positive_predictions() -> None:
+    m = binary_metrics([0, 1, 1], [0.1, 0.2, 0.3])
+    assert m["f1"] == 0.0
+    assert m["accuracy"] == pytest.approx(1 / 3)
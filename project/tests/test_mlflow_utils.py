@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import mlflow
+
+import src.common.mlflow_utils as mlflow_utils
+
+
+def test_set_active_experiment_caches_id(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(mlflow_utils, "EXPERIMENT_ID_CACHE", tmp_path / "ids.json")
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+    exp_id = mlflow_utils.set_active_experiment("exp")
+    assert (tmp_path / "ids.json").exists()
+
+    def _no_name_lookup(name: str):
+        raise AssertionError("cached id should skip the name lookup")
+
+    with monkeypatch.context() as m:
+        m.setattr(
+            mlflow.tracking.MlflowClient, "get_experiment_by_name", _no_name_lookup
+        )
+        assert mlflow_utils.set_active_experiment("exp") == exp_id
+
+
+def test_set_active_experiment_ignores_stale_cache(tmp_path: Path, monkeypatch) -> None:
+    cache = tmp_path / "ids.json"
+    monkeypatch.setattr(mlflow_utils, "EXPERIMENT_ID_CACHE", cache)
+    uri = (tmp_path / "mlruns").as_uri()
+    mlflow.set_tracking_uri(uri)
+    cache.write_text(f'{{"{uri}|exp": "999"}}')
+
+    exp_id = mlflow_utils.set_active_experiment("exp")
+
+    assert exp_id != "999"
+    assert mlflow.get_experiment(exp_id).name == "exp"
+    assert mlflow.get_experiment_by_name("exp").experiment_id == exp_id
+
+
+def test_set_model_version_tags_bounds_the_pool() -> None:
+    class _Client:
+        def __init__(self) -> None:
+            self.tags: dict[str, str] = {}
+            self.threads: set[str] = set()
+
+        def set_model_version_tag(
+            self, name: str, version: str, key: str, value: str
+        ) -> None:
+            self.threads.add(threading.current_thread().name)
+            self.tags[key] = value
+
+    client = _Client()
+    tags = {f"k{i}": str(i) for i in range(3 * mlflow_utils.MAX_TAG_WRITERS)}
+    mlflow_utils.set_model_version_tags(client, "m", "1", tags)  # type: ignore[arg-type]
+    assert client.tags == tags
+    assert len(client.threads) <= mlflow_utils.MAX_TAG_WRITERS
+
+    mlflow_utils.set_model_version_tags(client, "m", "1", {})  # type: ignore[arg-type]
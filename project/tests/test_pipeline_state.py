@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.common import pipeline_state
+
+
+def test_in_memory_mode_skips_the_filesystem(tmp_path: Path) -> None:
+    path = tmp_path / "TRAIN_RUN_ID"
+    pipeline_state.use_in_memory()
+    try:
+        pipeline_state.put(path, "abc")
+        assert pipeline_state.get(path) == "abc"
+        assert not path.exists()
+    finally:
+        pipeline_state.use_in_memory(False)
+
+
+def test_file_mode_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "TRAIN_RUN_ID"
+    pipeline_state.put(path, "abc")
+    assert path.read_text(encoding="utf-8") == "abc"
+    assert pipeline_state.get(path) == "abc"
+
+    with pytest.raises(FileNotFoundError):
+        pipeline_state.get(tmp_path / "missing")
@@ -7,16 +7,20 @@ import pytest
 
 from src.common.constants import (
     ALIAS_CANDIDATE,
+    ALIAS_CHAMPION,
     ALIAS_PROD,
     GATE_PASSED,
     TAG_CONFIG_HASH,
     TAG_DATASET_FINGERPRINT,
     TAG_GATE,
     TAG_GIT_SHA,
+    TAG_PREVIOUS_PROD_VERSION,
+    TAG_PROMOTED_FROM_ALIAS,
     TAG_RELEASE_STATUS,
     TAG_TRAINING_RUN_ID,
 )
 from src.policy.release_policy import evaluate_promotion_policy
+from src.promote import apply_promotion
 from src.promote import main as promote_main
 
 
@@ -30,7 +34,8 @@ class MlflowClientStub:
     """Tiny stub for policy and promote dry-run tests."""
 
     def __init__(self) -> None:
-        self._aliases: dict[tuple[str, str], str] = {}
+        # Alias -> version object directly (resolved at set_alias time): one lookup.
+        self._aliases: dict[tuple[str, str], _ModelVersion] = {}
         self._versions: dict[tuple[str, str], _ModelVersion] = {}
 
         # Mutation call tracking
@@ -43,12 +48,11 @@ class MlflowClientStub:
         )
 
     def set_alias(self, model_name: str, alias: str, version: str) -> None:
-        self._aliases[(model_name, alias)] = version
+        self._aliases[(model_name, alias)] = self._versions[(model_name, version)]
 
     # --- Read APIs used by policy ---
     def get_model_version_by_alias(self, model_name: str, alias: str) -> _ModelVersion:
-        v = self._aliases[(model_name, alias)]
-        return self._versions[(model_name, v)]
+        return self._aliases[(model_name, alias)]
 
     def get_model_version(self, model_name: str, version: str) -> _ModelVersion:
         return self._versions[(model_name, version)]
@@ -143,10 +147,10 @@ def test_dry_run_mode_has_zero_mutations(monkeypatch):
     client.put_version("m", "1", tags)
     client.set_alias("m", ALIAS_CANDIDATE, "1")
 
-    # Patch MlflowClient used in src.promote to our stub instance
+    # Patch the client accessor used in src.promote to return our stub instance
     import src.promote as promote_mod
 
-    monkeypatch.setattr(promote_mod, "MlflowClient", lambda: client)
+    monkeypatch.setattr(promote_mod, "get_client", lambda: client)
 
     # Run promote in dry-run mode: must exit 0 and must not mutate
     with pytest.raises(SystemExit) as e:
@@ -155,3 +159,65 @@ def test_dry_run_mode_has_zero_mutations(monkeypatch):
 
     assert client.set_registered_model_alias_calls == []
     assert client.set_model_version_tag_calls == []
+
+
+def test_apply_promotion_sets_aliases_and_evidence_tags():
+    client = MlflowClientStub()
+    client.put_version("m", "1", {})
+    client.put_version("m", "2", _valid_candidate_tags())
+
+    apply_promotion(client, "m", "2", ALIAS_CANDIDATE, prev_prod_version="1")
+
+    aliases = {args[1] for args, _ in client.set_registered_model_alias_calls}
+    assert aliases == {ALIAS_PROD, ALIAS_CHAMPION}
+    calls = [
+        {**dict(zip(("name", "version", "key", "value"), args)), **kwargs}
+        for args, kwargs in client.set_model_version_tag_calls
+    ]
+    tags = {(c["version"], c["key"]): c["value"] for c in calls}
+    assert tags == {
+        ("2", TAG_RELEASE_STATUS): ALIAS_PROD,
+        ("2", TAG_PROMOTED_FROM_ALIAS): ALIAS_CANDIDATE,
+        ("2", TAG_PREVIOUS_PROD_VERSION): "1",
+        ("1", TAG_RELEASE_STATUS): "previous_prod",
+    }
+
+
+def test_promotion_to_other_alias_records_the_actual_prod_version(monkeypatch):
+    import src.promote as promote_mod
+
+    client = MlflowClientStub()
+    client.put_version("m", "1", {})
+    client.put_version("m", "2", _valid_candidate_tags())
+    client.put_version("m", "3", {})
+    client.set_alias("m", ALIAS_PROD, "1")
+    client.set_alias("m", "staging", "3")
+    client.set_alias("m", ALIAS_CANDIDATE, "2")
+    monkeypatch.setattr(promote_mod, "get_client", lambda: client)
+
+    promote_main(["--model-name", "m", "--to-alias", "staging", "--format", "text"])
+
+    calls = [
+        {**dict(zip(("name", "version", "key", "value"), args)), **kwargs}
+        for args, kwargs in client.set_model_version_tag_calls
+    ]
+    tags = {(c["version"], c["key"]): c["value"] for c in calls}
+    # apply_promotion moves prod, so the handoff points at prod's version (1),
+    # not at the version behind --to-alias (3).
+    assert tags[("2", TAG_PREVIOUS_PROD_VERSION)] == "1"
+    assert tags[("1", TAG_RELEASE_STATUS)] == "previous_prod"
+
+
+def test_json_decision_output_matches_to_dict(capsys):
+    import json
+
+    from src.promote import _print_decision
+
+    client = MlflowClientStub()
+    decision = evaluate_promotion_policy(client, model_name="m")
+
+    _print_decision(decision, "json")
+
+    # Byte-for-byte: the key order is part of the CLI output, not just the values.
+    expected = json.dumps(decision.to_dict(), indent=2, sort_keys=True) + "\n"
+    assert capsys.readouterr().out == expected
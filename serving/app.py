@@ -1,30 +1,49 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import math
+import operator
+import os
+import random
 import time
-import uuid
-from collections.abc import Awaitable, Callable, AsyncGenerator
+import weakref
+from collections.abc import AsyncGenerator, Callable, Hashable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, Literal, cast
 
+import numpy as np
+import orjson
 import pandas as pd
-from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from pydantic import BaseModel, Field
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
-from starlette.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from starlette.datastructures import QueryParams
+from starlette.responses import Response, StreamingResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 try:
     import mlflow  # type: ignore
 except Exception:  # pragma: no cover
     mlflow = None  # type: ignore[assignment]
 
+from serving.batching import MicroBatcher
 from serving.constants import ALIAS_CANDIDATE, ALIAS_PROD, HEADER_REQUEST_ID
-from serving.metrics import PREDICT_LATENCY_SECONDS, REQUESTS_TOTAL, SHADOW_DIFF_MAE
+from serving.metrics import (
+    PREDICT_CACHE_HITS_TOTAL,
+    PREDICT_LATENCY_BY_LABELS,
+    REQUESTS_BY_LABELS,
+    SHADOW_DIFF_MAE_BY_LABELS,
+    endpoint_label,
+    mode_label,
+    render_metrics,
+)
+from serving.prediction_cache import TTLLRUCache, rows_digest
 from serving.router import (
     BucketContext,
     Mode,
+    RoutingDecision,
     SeedSource,
     choose_canary_bucket,
     decide_routing,
@@ -39,12 +58,17 @@ model_prod: Any | None = None
 model_candidate: Any | None = None
 prod_version: str | None = None
 candidate_version: str | None = None
-_last_refresh_ts: float = 0.0
+# time.monotonic() of the last refresh; -inf means "never" (monotonic may be small).
+_last_refresh_ts: float = -math.inf
+
+
+# Threads for blocking, GIL-releasing model.predict calls (per pool).
+INFERENCE_THREADS = min(32, (os.cpu_count() or 1) * 2)
 
 
 # App lifecycle
 def _configure_logging(settings: Settings) -> None:
-    # Being called repeatedly, basicConfig is a no-op after first call.
+    # Once, at startup: handlers must not take the logging lock per request.
     logging.basicConfig(level=settings.log_level)
 
 
@@ -52,68 +76,120 @@ def _configure_logging(settings: Settings) -> None:
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     _configure_logging(settings)
+    # model.predict runs in the default executor (see MicroBatcher); size it for
+    # blocking, GIL-releasing inference rather than asyncio's I/O default.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=INFERENCE_THREADS)
+    )
+    # Load prod before taking traffic; readiness reports failures, so don't crash.
+    try:
+        await _ensure_models_loaded(settings, load_candidate=False)
+    except Exception as e:
+        logger.warning("prod model not loaded at startup: %s", e)
+    # A candidate is optional (no alias between releases); load it if present.
+    if model_prod is not None:
+        try:
+            await _ensure_models_loaded(settings, load_candidate=True)
+        except Exception as e:
+            logger.info("candidate model not loaded at startup: %s", e)
+    await asyncio.to_thread(_warm_up_models)
     logger.info("serving started")
     yield
     logger.info("serving stopped")
 
 
-app = FastAPI(lifespan=lifespan)
+class OrjsonResponse(Response):
+    """JSON response rendered by orjson (NumPy arrays serialized natively)."""
 
+    media_type = "application/json"
 
-# Middleware
-@app.middleware("http")
-async def request_id_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Every JSON endpoint renders through orjson (FastAPI's own ORJSONResponse is
+# deprecated in current FastAPI releases).
+app = FastAPI(lifespan=lifespan, default_response_class=OrjsonResponse)
+
+
+# Middleware (pure ASGI: no per-request task or Request/Response wrapping)
+_REQUEST_ID_HEADER_KEY = HEADER_REQUEST_ID.lower().encode("latin-1")
+
+
+class RequestIdMiddleware:
     """Ensure every request has a request-id.
 
     If client supplies X-Request-Id, keep it for deterministic bucketing.
-    Otherwise generate one.
+    Otherwise generate one. The decision lives in scope["state"] (what
+    `request.state` reads) and the id is echoed on the response.
     """
-    incoming = request.headers.get(HEADER_REQUEST_ID)
-    if incoming and incoming.strip():
-        request.state.request_id = incoming.strip()
-        request.state.client_provided_request_id = True
-    else:
-        request.state.request_id = uuid.uuid4().hex
-        request.state.client_provided_request_id = False
 
-    response = await call_next(request)
-    response.headers[HEADER_REQUEST_ID] = request.state.request_id
-    return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-@app.middleware("http")
-async def coarse_metrics_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
+        incoming = ""
+        for key, value in scope["headers"]:
+            if key == _REQUEST_ID_HEADER_KEY:
+                incoming = value.decode("latin-1").strip()
+                break
+
+        state = scope.setdefault("state", {})
+        # 128 random bits as 32 hex chars, like uuid4().hex without the UUID object.
+        state["request_id"] = incoming or os.urandom(16).hex()
+        state["client_provided_request_id"] = bool(incoming)
+        # Request start, for handlers' latency metrics (one clock read per request).
+        state["t0_ns"] = time.perf_counter_ns()
+        header = (_REQUEST_ID_HEADER_KEY, state["request_id"].encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+class CoarseMetricsMiddleware:
     """Count all requests (bounded labels)."""
 
-    endpoint = request.url.path
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    # Avoid self-scrape recursion / noise.
-    if endpoint == "/metrics":
-        return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        endpoint = scope.get("path", "")
+        # Avoid self-scrape recursion / noise.
+        if scope["type"] != "http" or endpoint == "/metrics":
+            await self.app(scope, receive, send)
+            return
 
-    mode_label = request.query_params.get("mode", "") if endpoint == "/predict" else ""
+        mode = mode_label(
+            QueryParams(scope["query_string"]).get("mode", "")
+            if endpoint == "/predict"
+            else ""
+        )
+        endpoint = endpoint_label(endpoint)
+        status = "500"
+
+        async def send_capturing_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_capturing_status)
+        finally:
+            REQUESTS_BY_LABELS(endpoint, mode, status).inc()
 
-    try:
-        response = await call_next(request)
-    except HTTPException as e:
-        REQUESTS_TOTAL.labels(
-            endpoint=endpoint, mode=mode_label, status=str(e.status_code)
-        ).inc()
-        raise
-    except Exception:
-        REQUESTS_TOTAL.labels(endpoint=endpoint, mode=mode_label, status="500").inc()
-        raise
 
-    REQUESTS_TOTAL.labels(
-        endpoint=endpoint, mode=mode_label, status=str(response.status_code)
-    ).inc()
-    return response
+# Registered innermost first: metrics wraps request-id, as with the old decorators.
+app.add_middleware(RequestIdMiddleware)
+app.add_middleware(CoarseMetricsMiddleware)
 
 
 # Schemas
@@ -123,6 +199,52 @@ class PredictRequest(BaseModel):
     )
 
 
+Rows = list[dict[str, Any]]
+
+
+async def _payload_rows(request: Request) -> Rows:
+    """Decode the /predict body with orjson and check its shape.
+
+    Equivalent to validating `PredictRequest`, without building a pydantic
+    model over every row dict; the rows are handed to the model unchanged.
+    """
+    try:
+        obj = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"invalid JSON body: {e}") from e
+    rows = obj.get("rows") if isinstance(obj, dict) else None
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise HTTPException(
+            status_code=422, detail="body must be {'rows': [{feature: value}, ...]}"
+        )
+    return rows
+
+
+# Responses with at least this many probabilities are streamed in chunks.
+STREAM_MIN_ROWS = 16_384
+STREAM_CHUNK_ROWS = 4_096
+
+
+def _stream_json(body: dict[str, Any], proba: np.ndarray) -> StreamingResponse:
+    """`body` plus a "proba" array, encoded chunk by chunk.
+
+    Large batches never hold the whole encoded array in memory at once and the
+    client gets the first bytes before the last chunk is encoded.
+    """
+
+    def chunks() -> Iterator[bytes]:
+        yield orjson.dumps(body)[:-1] + b',"proba":['
+        for start in range(0, proba.size, STREAM_CHUNK_ROWS):
+            part = orjson.dumps(
+                proba[start : start + STREAM_CHUNK_ROWS],
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+            yield (b"," if start else b"") + part[1:-1]
+        yield b"]}"
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
 class PredictResponse(BaseModel):
     mode: Mode
     n: int
@@ -140,10 +262,9 @@ class _UnitTestModel:
     Keeps /predict behavior stable without requiring MLflow.
     """
 
-    def predict(self, df: pd.DataFrame) -> list[float]:
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
         # Return deterministic "probabilities" in [0,1].
-        n = len(df)
-        return [1.0] * n
+        return np.ones(len(df))
 
 
 def _models_uri(settings: Settings, alias: str) -> str:
@@ -165,6 +286,52 @@ def _registry_resolves_prod_alias(settings: Settings) -> tuple[bool, str | None]
         return False, f"registry check failed: {e}"
 
 
+# (checked_at monotonic, ok, detail) of the last registry check; a timeout counts
+# as a failed check.
+_registry_check: tuple[float, bool, str | None] | None = None
+# Registry checks get their own single thread and at most one runs at a time: a
+# hung registry must not pile up threads or occupy the inference executor.
+_registry_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="registry-check"
+)
+_registry_future: Future[tuple[bool, str | None]] | None = None
+
+
+async def _registry_status(settings: Settings) -> tuple[bool, str | None]:
+    """`_registry_resolves_prod_alias` for probe handlers: cached and time-bounded.
+
+    Results are reused for `registry_check_ttl_sec`. A refresh waits at most
+    `registry_check_timeout_sec`; a timeout is recorded as a failed check, so
+    probes back off for the TTL while the one in-flight check finishes.
+    """
+    global _registry_check, _registry_future
+    last = _registry_check
+    if (
+        last is not None
+        and time.monotonic() - last[0] < settings.registry_check_ttl_sec
+    ):
+        return last[1], last[2]
+
+    if _registry_future is None or _registry_future.done():
+        _registry_future = _registry_executor.submit(
+            _registry_resolves_prod_alias, settings
+        )
+    try:
+        # Shielded: timing out must not cancel the shared check.
+        ok, detail = await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(_registry_future)),
+            timeout=settings.registry_check_timeout_sec,
+        )
+    except TimeoutError:
+        ok = False
+        detail = (
+            f"registry check timed out after {settings.registry_check_timeout_sec}s"
+        )
+
+    _registry_check = (time.monotonic(), ok, detail)
+    return ok, detail
+
+
 def _get_version(settings: Settings, alias: str) -> str | None:
     if settings.unit_testing or mlflow is None:
         return None
@@ -209,7 +376,7 @@ def _refresh_models_if_needed(
         candidate_version, \
         _last_refresh_ts
 
-    now = time.time()
+    now = time.monotonic()
     if not force and (now - _last_refresh_ts) < settings.model_cache_ttl_sec:
         return
 
@@ -228,25 +395,373 @@ def _refresh_models_if_needed(
     _last_refresh_ts = now
 
 
-def _get_model(
-    settings: Settings, alias: Literal["prod", "candidate"], required: bool
-) -> Any | None:
-    _refresh_models_if_needed(settings, load_candidate=(alias == ALIAS_CANDIDATE))
+# The refresh currently running, shared by every caller that needs it; a
+# caller that gives up waiting leaves it running rather than starting another.
+_model_load: asyncio.Future[None] | None = None
+
+
+def _models_ready(settings: Settings, load_candidate: bool) -> bool:
+    fresh = (time.monotonic() - _last_refresh_ts) < settings.model_cache_ttl_sec
+    return (
+        fresh
+        and model_prod is not None
+        and (not load_candidate or model_candidate is not None)
+    )
+
+
+async def _refresh_models(settings: Settings, load_candidate: bool) -> None:
+    before = (model_prod, model_candidate)
+    try:
+        await asyncio.to_thread(
+            _refresh_models_if_needed,
+            settings,
+            force=True,
+            load_candidate=load_candidate,
+        )
+    finally:
+        # Cleared here, on the loop: the cache is not thread-safe.
+        if _predict_cache is not None and (
+            model_prod is not before[0] or model_candidate is not before[1]
+        ):
+            _predict_cache.clear()
+
+
+def _start_model_load(settings: Settings, load_candidate: bool) -> asyncio.Future[None]:
+    global _model_load
+    if _model_load is None or _model_load.done():
+        _model_load = asyncio.ensure_future(_refresh_models(settings, load_candidate))
+        # Nobody may be waiting when it fails; mark the error as retrieved.
+        _model_load.add_done_callback(lambda f: f.cancelled() or f.exception())
+    return _model_load
+
+
+async def _ensure_models_loaded(settings: Settings, *, load_candidate: bool) -> None:
+    """Event-loop-safe `_refresh_models_if_needed` for async handlers.
+
+    Warm path returns at once. Otherwise the refresh runs in a worker thread
+    (load_model is disk + network bound and would stall every request on this
+    worker); at most one runs at a time, and callers wait on it for up to
+    `model_load_timeout_sec`. Cached /predict responses are dropped when a
+    model is (re)loaded, even if every caller has stopped waiting.
+    """
+    if _models_ready(settings, load_candidate):
+        return
+    try:
+        async with asyncio.timeout(settings.model_load_timeout_sec):
+            if _model_load is not None and not _model_load.done():
+                # Join the running refresh; a prod-only one may not cover us.
+                await asyncio.shield(_model_load)
+                if _models_ready(settings, load_candidate):
+                    return
+            await asyncio.shield(_start_model_load(settings, load_candidate))
+    except TimeoutError:
+        raise RuntimeError(
+            f"model load timed out after {settings.model_load_timeout_sec}s"
+        ) from None
+
+
+def _get_model(alias: Literal["prod", "candidate"], required: bool) -> Any | None:
+    """The loaded model for `alias`; loading is `_ensure_models_loaded`'s job."""
     model = model_prod if alias == ALIAS_PROD else model_candidate
     if required and model is None:
         raise RuntimeError(f"model for alias={alias} is not available")
     return model
 
 
-def _prod_model_loadable(settings: Settings) -> tuple[bool, str | None]:
+async def _prod_model_loadable(settings: Settings) -> tuple[bool, str | None]:
     """Return (ok, detail). Ensures prod model can be used for traffic."""
     try:
-        _ = _get_model(settings, ALIAS_PROD, required=True)
+        await _ensure_models_loaded(settings, load_candidate=False)
+        _ = _get_model(ALIAS_PROD, required=True)
         return True, None
     except Exception as e:
         return False, f"prod model not loadable: {e}"
 
 
+# Batched prediction
+BatchResult = tuple[np.ndarray, np.ndarray | None]
+
+_batcher: MicroBatcher[BatchResult] | None = None
+
+
+class _PerModelMemo:
+    """Memo keyed by model identity; an entry is dropped when its model is.
+
+    pyfunc models are unhashable, so this can't be a WeakKeyDictionary.
+    Objects that can't be weakly referenced are simply not memoized.
+    """
+
+    def __init__(self, compute: Callable[[Any], Any]) -> None:
+        self._compute = compute
+        self._data: dict[int, tuple[weakref.ref[Any], Any]] = {}
+
+    def __call__(self, model: Any) -> Any:
+        key = id(model)
+        entry = self._data.get(key)
+        if entry is not None and entry[0]() is model:
+            return entry[1]
+
+        value = self._compute(model)
+        try:
+            ref = weakref.ref(model, lambda _ref: self._data.pop(key, None))
+        except TypeError:
+            return value
+        self._data[key] = (ref, value)
+        return value
+
+
+def _probe_feature_columns(model: Any) -> tuple[str, ...] | None:
+    metadata = getattr(model, "metadata", None)
+    try:
+        schema = metadata.get_input_schema() if metadata is not None else None
+    except Exception:
+        return None
+    if schema is None or not schema.has_input_names():
+        return None
+    return tuple(schema.input_names())
+
+
+def _probe_dense_getter(model: Any) -> Callable[[dict[str, Any]], Any] | None:
+    cols = _feature_columns(model)
+    if not cols:
+        return None
+    try:
+        types = model.metadata.get_input_schema().input_types()
+    except Exception:
+        return None
+    if not all(getattr(t, "name", None) == "double" for t in types):
+        return None
+    if len(cols) == 1:
+        (col,) = cols
+        return lambda row: (row[col],)
+    return operator.itemgetter(*cols)
+
+
+# Probed once per loaded model (follows model reloads):
+# input column names from the MLflow signature, if it has one...
+_feature_columns: Callable[[Any], tuple[str, ...] | None] = _PerModelMemo(
+    _probe_feature_columns
+)
+# ...and a row -> values tuple getter when every signature input is a double.
+_dense_getter: Callable[[Any], Callable[[dict[str, Any]], Any] | None] = _PerModelMemo(
+    _probe_dense_getter
+)
+
+
+_JSON_NUMBER_TYPES = frozenset({int, float})
+
+
+def _missing_features(model: Any, rows: Rows) -> list[str]:
+    """Signature columns that no row provides."""
+    cols = _feature_columns(model)
+    if not cols or not rows:
+        return []
+    present = set().union(*rows)
+    return [c for c in cols if c not in present]
+
+
+def _to_frame(model: Any, rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the model input; with known columns, skip pandas' dict inference.
+
+    All-double signatures (the usual sklearn case) fill one float64 block and
+    wrap it without copying, provided every value is a plain JSON number. Rows
+    holding anything else (bools, None, strings) or missing a column go through
+    from_records, so MLflow's schema enforcement still rejects them. A
+    signature column that no row provides raises, rather than being filled
+    with NaN.
+    """
+    cols = _feature_columns(model)
+    if cols is None:
+        return pd.DataFrame(rows)
+
+    getter = _dense_getter(model)
+    if getter is not None:
+        try:
+            values = [getter(r) for r in rows]
+        except KeyError:
+            pass
+        else:
+            # bool is an int subclass, so compare exact types.
+            if {type(v) for vs in values for v in vs} <= _JSON_NUMBER_TYPES:
+                arr = np.array(values, dtype=np.float64)
+                arr = arr.reshape(len(rows), len(cols))
+                return pd.DataFrame(arr, columns=list(cols), copy=False)
+
+    missing = _missing_features(model, rows)
+    if missing:
+        raise ValueError(f"Model is missing inputs {missing}")
+    return pd.DataFrame.from_records(rows, columns=cols)
+
+
+def _warm_up_models() -> None:
+    """Push one dummy row per loaded model through the request path.
+
+    The first real request then skips lazy init: the model's first predict, the
+    signature probes behind _to_frame, output conversion, cache-key hashing and
+    the orjson response encoder. Best-effort: a model without a named signature
+    cannot be given a synthetic row and is skipped.
+    """
+    for model in (model_prod, model_candidate):
+        if model is None:
+            continue
+        cols = _feature_columns(model)
+        if not cols:
+            continue
+        rows = [dict.fromkeys(cols, 0.0)]
+        try:
+            raw = model.predict(_to_frame(model, rows))
+        except Exception as e:
+            logger.warning("model warm-up predict failed: %s", e)
+            continue
+        rows_digest(rows)
+        OrjsonResponse({"proba": np.asarray(raw, dtype=np.float64).ravel()})
+
+
+# Shadow predicts run here, alongside the primary predict in the batch thread.
+# Threads start lazily, so an idle pool costs nothing.
+_shadow_executor = ThreadPoolExecutor(
+    max_workers=INFERENCE_THREADS, thread_name_prefix="shadow-predict"
+)
+
+
+def _as_scores(raw: Any, n_rows: int) -> np.ndarray:
+    """Model output as one float64 score per row; any other shape raises.
+
+    Batched requests are sliced out of this array by row offset, so a wrong
+    length would hand callers each other's scores.
+    """
+    y = np.asarray(raw, dtype=np.float64).ravel()
+    if y.shape != (n_rows,):
+        raise ValueError(
+            f"model returned shape {np.shape(raw)} for {n_rows} rows;"
+            " expected one score per row"
+        )
+    return y
+
+
+def _predict_shadow(
+    model_shadow: Any, model_primary: Any, df: pd.DataFrame, rows: Rows
+) -> np.ndarray | None:
+    """Best-effort shadow prediction; never fails the request."""
+    try:
+        # Same signature (the usual case) -> reuse the primary frame's data. The
+        # shallow copy keeps pandas' internal bookkeeping per thread.
+        shadow_df = (
+            df.copy(deep=False)
+            if _feature_columns(model_shadow) == _feature_columns(model_primary)
+            else _to_frame(model_shadow, rows)
+        )
+        return _as_scores(model_shadow.predict(shadow_df), len(rows))
+    except Exception as e:
+        logger.warning("shadow prediction failed: %s", e)
+        return None
+
+
+def _predict_batch(key: Hashable, rows: list[dict[str, Any]]) -> BatchResult:
+    """Run the primary (and optional shadow) model once over a coalesced batch.
+
+    The shadow model predicts concurrently on its own thread: sklearn releases
+    the GIL in its NumPy kernels, so shadow/canary cost ~max, not sum, of both.
+    """
+    primary_alias, shadow_alias, _columns = cast(tuple[Any, Any, Any], key)
+
+    model_primary = _get_model(primary_alias, required=True)
+    df = _to_frame(model_primary, rows)
+
+    shadow_future = None
+    if shadow_alias is not None:
+        model_shadow = _get_model(shadow_alias, required=False)
+        if model_shadow is not None:
+            shadow_future = _shadow_executor.submit(
+                _predict_shadow, model_shadow, model_primary, df, rows
+            )
+
+    raw_primary = model_primary.predict(df)  # type: ignore[union-attr]
+    y_primary = _as_scores(raw_primary, len(rows))
+    y_shadow = shadow_future.result() if shadow_future is not None else None
+    return y_primary, y_shadow
+
+
+def _split_batch(result: BatchResult, offset: int, length: int) -> BatchResult:
+    y_primary, y_shadow = result
+    end = offset + length
+    return y_primary[offset:end], (
+        y_shadow[offset:end] if y_shadow is not None else None
+    )
+
+
+def _get_batcher(settings: Settings) -> MicroBatcher[BatchResult]:
+    global _batcher
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            _predict_batch,
+            _split_batch,
+            max_batch_size=settings.batch_max_size,
+            max_wait_s=settings.batch_max_wait_ms / 1000.0,
+        )
+    return _batcher
+
+
+_predict_cache: TTLLRUCache | None = None
+
+
+def _get_predict_cache(settings: Settings) -> TTLLRUCache | None:
+    """Response cache for repeat payloads; None when disabled (TTL or size 0)."""
+    global _predict_cache
+    if settings.predict_cache_ttl_sec <= 0 or settings.predict_cache_size <= 0:
+        return None
+    if _predict_cache is None:
+        _predict_cache = TTLLRUCache(
+            maxsize=settings.predict_cache_size,
+            ttl_s=settings.predict_cache_ttl_sec,
+        )
+    return _predict_cache
+
+
+# Routing, specialized per mode: only canary needs a bucket, the other modes'
+# decisions are fixed and resolved once at import.
+Route = tuple[RoutingDecision, int | None, SeedSource | None]
+RouteFn = Callable[[dict[str, Any], Rows, Settings], Route]
+
+
+def _fixed_route(mode: Mode) -> RouteFn:
+    route: Route = (decide_routing(mode=mode, canary_pct=0, bucket=0), None, None)
+
+    def _route(_state: dict[str, Any], _rows: Rows, _settings: Settings) -> Route:
+        return route
+
+    return _route
+
+
+def _canary_route(state: dict[str, Any], rows: Rows, settings: Settings) -> Route:
+    bd = choose_canary_bucket(
+        BucketContext(
+            request_id=state.get("request_id"),
+            client_provided_request_id=bool(
+                state.get("client_provided_request_id", False)
+            ),
+            rows=rows,
+        )
+    )
+    decision = decide_routing(
+        mode="canary", canary_pct=settings.canary_pct, bucket=bd.bucket
+    )
+    return decision, bd.bucket, bd.seed_source
+
+
+_ROUTES: dict[str, RouteFn] = {
+    "prod": _fixed_route("prod"),
+    "candidate": _fixed_route("candidate"),
+    "shadow": _fixed_route("shadow"),
+    "canary": _canary_route,
+}
+
+_OTHER_ALIAS: dict[str, Literal["prod", "candidate"]] = {
+    ALIAS_PROD: ALIAS_CANDIDATE,
+    ALIAS_CANDIDATE: ALIAS_PROD,
+}
+
+
 # Health / metrics
 @app.get("/livez")
 def livez() -> dict[str, str]:
@@ -255,17 +770,16 @@ def livez() -> dict[str, str]:
 
 
 @app.get("/readyz")
-def readyz() -> Response:
+async def readyz() -> Response:
     settings = get_settings()
-    _configure_logging(settings)
 
-    reg_ok, reg_detail = _registry_resolves_prod_alias(settings)
+    reg_ok, reg_detail = await _registry_status(settings)
     if not reg_ok:
         return Response(
             content=reg_detail or "not ready", status_code=503, media_type="text/plain"
         )
 
-    model_ok, model_detail = _prod_model_loadable(settings)
+    model_ok, model_detail = await _prod_model_loadable(settings)
     if not model_ok:
         return Response(
             content=model_detail or "not ready",
@@ -277,13 +791,11 @@ def readyz() -> Response:
 
 
 @app.get("/health")
-def health() -> dict[str, Any]:
+async def health() -> dict[str, Any]:
     settings = get_settings()
-    _configure_logging(settings)
-
-    reg_ok, reg_detail = _registry_resolves_prod_alias(settings)
-    _refresh_models_if_needed(settings, load_candidate=False)
 
+    # Report only: loading models is startup's / readyz's job, not a probe's.
+    reg_ok, reg_detail = await _registry_status(settings)
     model_loaded = model_prod is not None
     ready = bool(reg_ok and model_loaded)
 
@@ -304,124 +816,144 @@ def health() -> dict[str, Any]:
 
 @app.get("/metrics")
 def metrics() -> Response:
-    payload = generate_latest()
-    return Response(payload, media_type=CONTENT_TYPE_LATEST)
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 # Prediction
-@app.post("/predict", response_model=PredictResponse)
+@app.post(
+    "/predict",
+    response_model=PredictResponse,
+    # The body is parsed by _payload_rows; keep it documented in the schema.
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": PredictRequest.model_json_schema()}
+            },
+        }
+    },
+)
 async def predict(
     request: Request,
-    payload: PredictRequest,
+    rows: Rows = Depends(_payload_rows),
     mode: Mode = Query(default="prod", description="prod|candidate|shadow|canary"),
-) -> PredictResponse:
+) -> Response:
     settings = get_settings()
-    _configure_logging(settings)
 
-    t0 = time.perf_counter()
     status_code: int = 200
     chosen_label: Literal["prod", "candidate", "unknown"] = "unknown"
 
-    bucket: int | None = None
-    bucket_seed_source: SeedSource | None = None
     shadow_mae: float | None = None
 
+    # Populated by RequestIdMiddleware.
+    state = request.scope.get("state", {})
+    t0_ns: int = state.get("t0_ns") or time.perf_counter_ns()
+    latency_s: float | None = None
+
     try:
-        # Routing decision (deterministic bucket only in canary mode)
-        if mode == "canary":
-            bd = choose_canary_bucket(
-                BucketContext(
-                    request_id=getattr(request.state, "request_id", None),
-                    client_provided_request_id=bool(
-                        getattr(request.state, "client_provided_request_id", False)
-                    ),
-                    rows=payload.rows,
-                )
-            )
-            bucket = bd.bucket
-            bucket_seed_source = bd.seed_source
-            decision = decide_routing(
-                mode=mode,
-                canary_pct=settings.canary_pct,
-                bucket=bucket,
-            )
-        else:
-            decision = decide_routing(
-                mode=mode,
-                canary_pct=settings.canary_pct,
-                bucket=0,
-            )
+        decision, bucket, bucket_seed_source = _ROUTES[mode](state, rows, settings)
 
         primary_alias: Literal["prod", "candidate"] = decision.chosen
         chosen_label = primary_alias
-
-        shadow_alias = cast(
-            Literal["prod", "candidate"],
-            ALIAS_CANDIDATE if primary_alias == ALIAS_PROD else ALIAS_PROD,
-        )
+        shadow_alias = _OTHER_ALIAS[primary_alias]
 
         # Important: ensure candidate is loaded only when needed (candidate traffic or shadow run).
-        _refresh_models_if_needed(
+        await _ensure_models_loaded(
             settings,
             load_candidate=(primary_alias == ALIAS_CANDIDATE or decision.run_shadow),
         )
 
         # Primary model must exist for prod/candidate routes.
-        model_primary = _get_model(settings, primary_alias, required=True)
+        model_primary = _get_model(primary_alias, required=True)
         if model_primary is None:
             status_code = 503
             raise HTTPException(
                 status_code=503, detail=f"model not available: {primary_alias}"
             )
+        # Checked per request: in a shared batch, another request's rows
+        # could otherwise supply the column.
+        missing = _missing_features(model_primary, rows)
+        if missing:
+            status_code = 422
+            raise HTTPException(
+                status_code=422, detail=f"missing model inputs: {missing}"
+            )
 
-        df = pd.DataFrame(payload.rows)
-        y_primary = model_primary.predict(df)  # type: ignore[union-attr]
-        y_primary_list = [float(x) for x in list(y_primary)]
-
-        # Optional shadow prediction (best-effort, never fails request)
-        if decision.run_shadow:
-            model_shadow = _get_model(settings, shadow_alias, required=False)
-            if model_shadow is not None:
-                try:
-                    y_shadow = model_shadow.predict(df)  # type: ignore[union-attr]
-                    y_shadow_list = [float(x) for x in list(y_shadow)]
-                    diffs = [abs(a - b) for a, b in zip(y_primary_list, y_shadow_list)]
-                    shadow_mae = sum(diffs) / max(len(diffs), 1)
-                except Exception as e:
-                    logger.warning("shadow prediction failed: %s", e)
-
-        latency_s = time.perf_counter() - t0
+        # Repeat payloads for the same model version skip inference entirely.
+        # Shadow runs always predict: comparing the two models is the point.
+        cache = _get_predict_cache(settings)
+        cache_key: tuple[Any, ...] | None = None
+        y_primary: np.ndarray | None = None
+        y_shadow: np.ndarray | None = None
+        if cache is not None and not decision.run_shadow:
+            version = prod_version if primary_alias == ALIAS_PROD else candidate_version
+            cache_key = (primary_alias, version, rows_digest(rows))
+            y_primary = cache.get(cache_key)
+            if y_primary is not None:
+                PREDICT_CACHE_HITS_TOTAL.inc()
+
+        if y_primary is None:
+            # Concurrent requests with the same routing and feature layout share
+            # one model.predict call (shadow included); we get back our slice.
+            batch_key = (
+                primary_alias,
+                shadow_alias if decision.run_shadow else None,
+                tuple(rows[0]) if rows else (),
+            )
+            y_primary, y_shadow = await _get_batcher(settings).submit(batch_key, rows)
+            if cache is not None and cache_key is not None:
+                # Own the slice so the cache does not pin the whole batch array.
+                cache.put(cache_key, y_primary.copy())
+
+        # The MAE histogram is a statistical aggregate: a sample of requests is
+        # enough, and the rest skip the reduction.
+        if (
+            y_shadow is not None
+            and y_shadow.size
+            and random.random() < settings.shadow_mae_sample_rate
+        ):
+            shadow_mae = float(np.abs(y_primary - y_shadow).mean())
+
+        latency_s = (time.perf_counter_ns() - t0_ns) / 1e9
 
         if shadow_mae is not None and math.isfinite(shadow_mae):
-            SHADOW_DIFF_MAE.labels(mode=str(mode)).observe(shadow_mae)
-
-        log: dict[str, Any] = {
-            "event": "predict",
-            "request_id": getattr(request.state, "request_id", None),
+            SHADOW_DIFF_MAE_BY_LABELS(str(mode)).observe(shadow_mae)
+
+        # Only build and encode the line when INFO is actually emitted.
+        if logger.isEnabledFor(logging.INFO):
+            log: dict[str, Any] = {
+                "event": "predict",
+                "request_id": state.get("request_id"),
+                "mode": mode,
+                "chosen": primary_alias,
+                "status": status_code,
+                "latency_ms": int(latency_s * 1000),
+                "bucket": bucket,
+                "bucket_seed_source": str(bucket_seed_source)
+                if bucket_seed_source
+                else None,
+                "canary_pct": settings.canary_pct if mode == "canary" else None,
+                "shadow_mae": shadow_mae,
+                "prod_version": prod_version,
+                "candidate_version": candidate_version,
+            }
+            logger.info(orjson.dumps(log).decode())
+
+        # Built by us, so skip response_model re-validation; orjson encodes the
+        # float64 array directly (no tolist()).
+        body: dict[str, Any] = {
             "mode": mode,
+            "n": len(rows),
             "chosen": primary_alias,
-            "status": status_code,
-            "latency_ms": int(latency_s * 1000),
             "bucket": bucket,
+            "canary_pct": settings.canary_pct if mode == "canary" else None,
             "bucket_seed_source": str(bucket_seed_source)
             if bucket_seed_source
             else None,
-            "canary_pct": settings.canary_pct if mode == "canary" else None,
-            "shadow_mae": shadow_mae,
-            "prod_version": prod_version,
-            "candidate_version": candidate_version,
         }
-        logger.info(json.dumps(log, separators=(",", ":")))
-
-        return PredictResponse(
-            mode=mode,
-            n=len(payload.rows),
-            proba=y_primary_list,
-            chosen=primary_alias,
-            bucket=bucket,
-            canary_pct=settings.canary_pct if mode == "canary" else None,
-            bucket_seed_source=str(bucket_seed_source) if bucket_seed_source else None,
-        )
+        if y_primary.size >= STREAM_MIN_ROWS:
+            return _stream_json(body, y_primary)
+        return OrjsonResponse({**body, "proba": y_primary})
 
     except HTTPException as e:
         status_code = e.status_code
@@ -436,9 +968,8 @@ async def predict(
         raise HTTPException(status_code=500, detail="internal error") from e
 
     finally:
-        latency_s = time.perf_counter() - t0
-        PREDICT_LATENCY_SECONDS.labels(
-            mode=str(mode),
-            status=str(status_code),
-            chosen=chosen_label,
-        ).observe(latency_s)
+        if latency_s is None:
+            latency_s = (time.perf_counter_ns() - t0_ns) / 1e9
+        PREDICT_LATENCY_BY_LABELS(str(mode), str(status_code), chosen_label).observe(
+            latency_s
+        )
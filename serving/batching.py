@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+Rows = list[dict[str, Any]]
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _PendingBatch:
+    rows: Rows = field(default_factory=list)
+    # (offset, length, future) per submitted request.
+    waiters: list[tuple[int, int, asyncio.Future[Any]]] = field(default_factory=list)
+    flushed: bool = False
+
+
+class MicroBatcher(Generic[T]):
+    """Coalesce concurrent requests with the same key into one model call.
+
+    Batching is adaptive: while no batch for a key is running, a new batch is
+    flushed on the next loop iteration, so a lone request pays no wait. While
+    one is running, requests accumulate into the next batch, which is flushed
+    as soon as the running one completes, after `max_wait_s`, or once it holds
+    `max_batch_size` rows, whichever comes first. Batch size thus follows load
+    and `max_wait_s` only bounds the added latency. `run_batch(key, rows)`
+    is called once per batch and must return something that `split` can slice
+    back into per-request results by `(offset, length)`.
+    If a batch fails, each request's rows are retried on their own, so an error
+    only reaches the request that caused it.
+
+    `run_batch` is blocking model work, so it runs in the loop's default
+    executor; the event loop keeps serving other requests meanwhile.
+
+    There is no background worker: flushes are scheduled on the running loop, so
+    the batcher works the same under uvicorn and per-request test loops.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[Hashable, Rows], T],
+        split: Callable[[T, int, int], Any],
+        *,
+        max_batch_size: int,
+        max_wait_s: float,
+    ) -> None:
+        self._run_batch = run_batch
+        self._split = split
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait_s
+        self._pending: dict[Hashable, _PendingBatch] = {}
+        # Batches currently running, per key.
+        self._running: dict[Hashable, int] = {}
+        # Strong refs to in-flight flushes (the loop only keeps weak ones).
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, key: Hashable, rows: Rows) -> Any:
+        if self._max_wait_s <= 0 or self._max_batch_size <= 1:
+            # Batching disabled: same result shape, no extra latency.
+            result = await asyncio.to_thread(self._run_batch, key, rows)
+            return self._split(result, 0, len(rows))
+
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        opened = batch is None
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+
+        fut: asyncio.Future[Any] = loop.create_future()
+        batch.waiters.append((len(batch.rows), len(rows), fut))
+        batch.rows.extend(rows)
+
+        if len(batch.rows) >= self._max_batch_size:
+            self._flush(key, batch)
+        elif opened and not self._running.get(key):
+            # Idle: let requests from the same loop iteration join, then run.
+            loop.call_soon(self._flush, key, batch)
+        elif opened:
+            loop.call_later(self._max_wait_s, self._flush, key, batch)
+
+        return await fut
+
+    def _flush(self, key: Hashable, batch: _PendingBatch) -> None:
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        self._running[key] = self._running.get(key, 0) + 1
+
+        task = asyncio.get_running_loop().create_task(self._complete(key, batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _complete(self, key: Hashable, batch: _PendingBatch) -> None:
+        try:
+            try:
+                result = await asyncio.to_thread(self._run_batch, key, batch.rows)
+            except Exception as e:
+                if len(batch.waiters) == 1:
+                    _, _, fut = batch.waiters[0]
+                    if not fut.done():
+                        fut.set_exception(e)
+                else:
+                    await self._run_individually(key, batch)
+                return
+        finally:
+            self._running[key] -= 1
+            if not self._running[key]:
+                del self._running[key]
+            # Requests that queued up behind this batch go next, without
+            # waiting out the rest of their timer.
+            waiting = self._pending.get(key)
+            if waiting is not None:
+                self._flush(key, waiting)
+
+        for offset, length, fut in batch.waiters:
+            self._resolve(fut, result, offset, length)
+
+    def _resolve(
+        self, fut: asyncio.Future[Any], result: T, offset: int, length: int
+    ) -> None:
+        """Hand `fut` its slice; a failing split fails only that request."""
+        if fut.done():
+            return
+        try:
+            fut.set_result(self._split(result, offset, length))
+        except Exception as e:
+            fut.set_exception(e)
+
+    async def _run_individually(self, key: Hashable, batch: _PendingBatch) -> None:
+        """Retry a failed batch per request, so an error stays with its request.
+
+        One bad payload (e.g. a value failing the model's schema) must not fail
+        the requests that merely shared its batch.
+        """
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._run_batch, key, batch.rows[offset : offset + length]
+                )
+                for offset, length, _ in batch.waiters
+            ),
+            return_exceptions=True,
+        )
+        for (_, length, fut), outcome in zip(batch.waiters, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not fut.done():
+                    fut.set_exception(outcome)
+            else:
+                self._resolve(fut, outcome, 0, length)
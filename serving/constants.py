@@ -16,6 +16,16 @@ ENV_CANARY_PCT = "CANARY_PCT"
 ENV_LOG_LEVEL = "LOG_LEVEL"
 ENV_UNIT_TESTING = "UNIT_TESTING"
 ENV_MODEL_CACHE_TTL_SEC = "MODEL_CACHE_TTL_SEC"
+ENV_MODEL_LOAD_TIMEOUT_SEC = "MODEL_LOAD_TIMEOUT_SEC"
+ENV_REGISTRY_CHECK_TTL_SEC = "REGISTRY_CHECK_TTL_SEC"
+ENV_REGISTRY_CHECK_TIMEOUT_SEC = "REGISTRY_CHECK_TIMEOUT_SEC"
+ENV_PREDICT_CACHE_SIZE = "PREDICT_CACHE_SIZE"
+ENV_PREDICT_CACHE_TTL_SEC = "PREDICT_CACHE_TTL_SEC"
+ENV_BATCH_MAX_SIZE = "BATCH_MAX_SIZE"
+ENV_BATCH_MAX_WAIT_MS = "BATCH_MAX_WAIT_MS"
+ENV_SHADOW_MAE_SAMPLE_RATE = "SHADOW_MAE_SAMPLE_RATE"
+# Read by prometheus_client itself; set it to aggregate metrics across workers.
+ENV_PROMETHEUS_MULTIPROC_DIR = "PROMETHEUS_MULTIPROC_DIR"
 
 # HTTP headers
 HEADER_REQUEST_ID = "X-Request-Id"
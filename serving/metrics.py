@@ -1,6 +1,63 @@
 from __future__ import annotations
 
-from prometheus_client import Counter, Histogram
+import os
+from typing import Any, Final
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from serving.constants import ENV_PROMETHEUS_MULTIPROC_DIR
+
+# Label values come from the request, so clamp them to known sets: anything else
+# (scanners, typos) collapses into one series instead of one per distinct URL.
+KNOWN_ENDPOINTS: Final[frozenset[str]] = frozenset(
+    {"/predict", "/health", "/readyz", "/livez", "/metrics"}
+)
+KNOWN_MODES: Final[frozenset[str]] = frozenset(
+    {"prod", "candidate", "shadow", "canary", ""}
+)
+OTHER_ENDPOINT: Final[str] = "other"
+INVALID_MODE: Final[str] = "invalid"
+
+
+def endpoint_label(path: str) -> str:
+    return path if path in KNOWN_ENDPOINTS else OTHER_ENDPOINT
+
+
+def mode_label(raw_mode: str) -> str:
+    return raw_mode if raw_mode in KNOWN_MODES else INVALID_MODE
+
+
+# Explicit buckets: few edges, spanning what each metric can actually take.
+# 5 ms .. 5 s for request latency.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+# MAE between two probabilities lies in [0, 1].
+SHADOW_MAE_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+)
 
 # Labels are bounded, we do not label by request_id, model_name, etc.
 REQUESTS_TOTAL = Counter(
@@ -13,11 +70,60 @@ PREDICT_LATENCY_SECONDS = Histogram(
     "predict_latency_seconds",
     "Latency of /predict requests in seconds.",
     labelnames=("mode", "status", "chosen"),
-    # Optional buckets, Prometheus defaults work good for now.
+    buckets=LATENCY_BUCKETS,
+)
+
+PREDICT_CACHE_HITS_TOTAL = Counter(
+    "predict_cache_hits_total",
+    "/predict requests answered from the response cache.",
 )
 
 SHADOW_DIFF_MAE = Histogram(
     "shadow_diff_mae",
     "Mean absolute difference between primary and shadow predictions (when shadow runs).",
     labelnames=("mode",),
+    buckets=SHADOW_MAE_BUCKETS,
 )
+
+
+class LabelChildren:
+    """Memoized `metric.labels(...)` children, keyed by positional label values.
+
+    `labels()` validates names and takes the metric's lock on every call; after
+    the first request per label combination this is a single dict lookup.
+    """
+
+    def __init__(self, metric: Any) -> None:
+        self._metric = metric
+        self._children: dict[tuple[str, ...], Any] = {}
+
+    def __call__(self, *values: str) -> Any:
+        try:
+            return self._children[values]
+        except KeyError:
+            child = self._children[values] = self._metric.labels(*values)
+            return child
+
+
+# Positional order follows each metric's labelnames.
+REQUESTS_BY_LABELS = LabelChildren(REQUESTS_TOTAL)
+PREDICT_LATENCY_BY_LABELS = LabelChildren(PREDICT_LATENCY_SECONDS)
+SHADOW_DIFF_MAE_BY_LABELS = LabelChildren(SHADOW_DIFF_MAE)
+
+# The steady-state /predict series exist from startup (and render as 0 until hit).
+for _mode in ("prod", "candidate", "shadow", "canary"):
+    REQUESTS_BY_LABELS("/predict", _mode, "200")
+
+
+def render_metrics() -> bytes:
+    """Exposition for /metrics.
+
+    With PROMETHEUS_MULTIPROC_DIR set (several uvicorn workers), samples are
+    aggregated across all worker processes instead of reporting whichever
+    worker happened to serve the scrape.
+    """
+    if not os.environ.get(ENV_PROMETHEUS_MULTIPROC_DIR):
+        return generate_latest()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import orjson
+import xxhash
+
+
+def rows_digest(rows: list[dict[str, Any]]) -> int:
+    """64-bit digest of the canonical (key-sorted) JSON encoding of `rows`."""
+    return xxhash.xxh3_64_intdigest(orjson.dumps(rows, option=orjson.OPT_SORT_KEYS))
+
+
+class TTLLRUCache:
+    """Bounded LRU whose entries also expire `ttl_s` seconds after insertion.
+
+    Only touched from the event loop, so no locking.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (self._clock() + self._ttl_s, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
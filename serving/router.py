@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import hashlib
-import json
 import secrets
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, Final, Literal, cast
 
+import orjson
+import xxhash
+
 from serving.constants import ALIAS_CANDIDATE, ALIAS_PROD
 
 MODE_PROD: Final[str] = "prod"
@@ -26,7 +28,7 @@ class SeedSource(StrEnum):
     RANDOM = "random"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoutingDecision:
     """Decision for which alias should be used for the response.
 
@@ -38,7 +40,7 @@ class RoutingDecision:
     run_shadow: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BucketContext:
     """Inputs for stable bucketing.
 
@@ -54,26 +56,32 @@ class BucketContext:
     rows: list[dict[str, Any]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BucketDecision:
     bucket: int
     seed_source: SeedSource
 
 
 def stable_bucket_from_bytes(payload: bytes) -> int:
-    """Returns a stable bucket in [0, 99] for arbitrary bytes."""
-    h = hashlib.sha256(payload).hexdigest()
-    return int(h, 16) % 100
+    """Returns a stable bucket in [0, 99] for arbitrary bytes.
+
+    Bucketing needs a well-mixed, stable hash, not a cryptographic one.
+    """
+    return xxhash.xxh3_64_intdigest(payload) % 100
 
 
+@lru_cache(maxsize=4096)
 def stable_bucket_from_str(seed: str) -> int:
-    """Returns a stable bucket in [0, 99] for a text seed."""
+    """Returns a stable bucket in [0, 99] for a text seed.
+
+    Cached: client request ids repeat on retries and idempotent replays.
+    """
     return stable_bucket_from_bytes(seed.encode("utf-8"))
 
 
 def stable_bucket_from_rows(rows: list[dict[str, Any]]) -> int:
     """Returns a stable bucket in [0, 99] based on request content."""
-    payload = json.dumps(rows, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    payload = orjson.dumps(rows, option=orjson.OPT_SORT_KEYS)
     return stable_bucket_from_bytes(payload)
 
 
@@ -98,13 +106,30 @@ def choose_canary_bucket(ctx: BucketContext) -> BucketDecision:
         )
     except Exception:
         # Defensive fallback: if payload isn't JSON-serializable for some reason.
-        seed = secrets.token_hex(16)
+        # One-off seed: hash it directly rather than filling the str cache.
+        seed = secrets.token_bytes(16)
         return BucketDecision(
-            bucket=stable_bucket_from_str(seed),
+            bucket=stable_bucket_from_bytes(seed),
             seed_source=SeedSource.RANDOM,
         )
 
 
+_PROD: Final[Alias] = cast(Alias, ALIAS_PROD)
+_CANDIDATE: Final[Alias] = cast(Alias, ALIAS_CANDIDATE)
+
+# Every possible decision, built once: routing is a lookup, not an allocation.
+_FIXED_DECISIONS: Final[dict[str, RoutingDecision]] = {
+    MODE_PROD: RoutingDecision(chosen=_PROD, run_shadow=False),
+    MODE_CANDIDATE: RoutingDecision(chosen=_CANDIDATE, run_shadow=False),
+    MODE_SHADOW: RoutingDecision(chosen=_PROD, run_shadow=True),
+}
+# Indexed by `bucket < canary_pct`.
+_CANARY_DECISIONS: Final[tuple[RoutingDecision, RoutingDecision]] = (
+    RoutingDecision(chosen=_PROD, run_shadow=True),
+    RoutingDecision(chosen=_CANDIDATE, run_shadow=True),
+)
+
+
 def decide_routing(mode: Mode, canary_pct: int, bucket: int) -> RoutingDecision:
     """Computes routing decision.
 
@@ -115,29 +140,17 @@ def decide_routing(mode: Mode, canary_pct: int, bucket: int) -> RoutingDecision:
       - canary: if bucket < canary_pct -> return candidate and also run prod
                else -> return prod and also run candidate
 
-    Note: we clamp canary_pct to [0, 100] for safety.
+    Note: we clamp canary_pct to [0, 100] for safety. Decisions are shared,
+    immutable instances.
     """
     if not (0 <= bucket <= 99):
         raise ValueError(f"bucket must be in [0, 99], got {bucket}")
 
-    canary_pct = max(0, min(100, int(canary_pct)))
-
-    # Use serving.constants for alias strings (single source of truth)
-    prod: Alias = cast(Alias, ALIAS_PROD)
-    candidate: Alias = cast(Alias, ALIAS_CANDIDATE)
-
-    if mode == MODE_PROD:
-        return RoutingDecision(chosen=prod, run_shadow=False)
-
-    if mode == MODE_CANDIDATE:
-        return RoutingDecision(chosen=candidate, run_shadow=False)
-
-    if mode == MODE_SHADOW:
-        return RoutingDecision(chosen=prod, run_shadow=True)
-
     if mode == MODE_CANARY:
-        if bucket < canary_pct:
-            return RoutingDecision(chosen=candidate, run_shadow=True)
-        return RoutingDecision(chosen=prod, run_shadow=True)
+        canary_pct = max(0, min(100, int(canary_pct)))
+        return _CANARY_DECISIONS[bucket < canary_pct]
 
-    raise ValueError(f"Unknown mode: {mode}")
+    decision = _FIXED_DECISIONS.get(mode)
+    if decision is None:
+        raise ValueError(f"Unknown mode: {mode}")
+    return decision
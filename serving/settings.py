@@ -9,12 +9,20 @@ from serving.constants import (
     ALIAS_CANDIDATE,
     ALIAS_PROD,
     DEFAULT_MODEL_NAME,
+    ENV_BATCH_MAX_SIZE,
+    ENV_BATCH_MAX_WAIT_MS,
     ENV_CANARY_PCT,
     ENV_CANDIDATE_ALIAS,
     ENV_LOG_LEVEL,
     ENV_MODEL_CACHE_TTL_SEC,
+    ENV_MODEL_LOAD_TIMEOUT_SEC,
     ENV_MODEL_NAME,
+    ENV_PREDICT_CACHE_SIZE,
+    ENV_PREDICT_CACHE_TTL_SEC,
     ENV_PROD_ALIAS,
+    ENV_REGISTRY_CHECK_TIMEOUT_SEC,
+    ENV_REGISTRY_CHECK_TTL_SEC,
+    ENV_SHADOW_MAE_SAMPLE_RATE,
     ENV_UNIT_TESTING,
 )
 
@@ -34,10 +42,42 @@ class Settings(BaseSettings):
     )
 
     canary_pct: int = Field(default=10, validation_alias=ENV_CANARY_PCT)
+    # Fraction of shadow/canary requests whose primary-vs-shadow MAE is recorded.
+    shadow_mae_sample_rate: float = Field(
+        default=1.0, ge=0.0, le=1.0, validation_alias=ENV_SHADOW_MAE_SAMPLE_RATE
+    )
     model_cache_ttl_sec: float = Field(
         default=60.0, validation_alias=ENV_MODEL_CACHE_TTL_SEC
     )
 
+    # Micro-batching of concurrent /predict calls; max_wait_ms=0 disables it.
+    batch_max_size: int = Field(default=256, validation_alias=ENV_BATCH_MAX_SIZE)
+    batch_max_wait_ms: float = Field(
+        default=5.0, validation_alias=ENV_BATCH_MAX_WAIT_MS
+    )
+
+    # Response cache for repeated identical payloads; ttl or size 0 disables it.
+    predict_cache_size: int = Field(
+        default=10_000, validation_alias=ENV_PREDICT_CACHE_SIZE
+    )
+    predict_cache_ttl_sec: float = Field(
+        default=30.0, validation_alias=ENV_PREDICT_CACHE_TTL_SEC
+    )
+
+    # Upper bound on a (threaded) model load awaited by a request or startup.
+    model_load_timeout_sec: float = Field(
+        default=120.0, validation_alias=ENV_MODEL_LOAD_TIMEOUT_SEC
+    )
+
+    # Probe endpoints reuse the last registry check for ttl seconds and never
+    # wait on the registry longer than timeout.
+    registry_check_ttl_sec: float = Field(
+        default=10.0, validation_alias=ENV_REGISTRY_CHECK_TTL_SEC
+    )
+    registry_check_timeout_sec: float = Field(
+        default=1.0, validation_alias=ENV_REGISTRY_CHECK_TIMEOUT_SEC
+    )
+
     log_level: str = Field(default="INFO", validation_alias=ENV_LOG_LEVEL)
 
     # Used to disable real MLflow loads during unit tests.
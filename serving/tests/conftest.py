@@ -17,4 +17,9 @@ def _force_unit_testing(monkeypatch: pytest.MonkeyPatch) -> None:
     appmod.model_candidate = None
     appmod.prod_version = None
     appmod.candidate_version = None
-    appmod._last_refresh_ts = 0.0
+    appmod._last_refresh_ts = float("-inf")
+    appmod._batcher = None
+    appmod._predict_cache = None
+    appmod._registry_check = None
+    appmod._registry_future = None
+    appmod._model_load = None
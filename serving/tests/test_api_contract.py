@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Protocol, Sequence
 
+import numpy as np
 import pandas as pd
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -22,9 +23,9 @@ class _FakeModel:
     def __init__(self, value: float) -> None:
         self._value = float(value)
 
-    def predict(self, df: pd.DataFrame) -> list[float]:
-        # Return one value per row.
-        return [self._value for _ in range(len(df))]
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        # One value per row, as an ndarray like a real sklearn pyfunc.
+        return np.full(len(df), self._value)
 
 
 @pytest.fixture()
@@ -87,6 +88,25 @@ def test_predict_invalid_payload_422(client: TestClient) -> None:
     assert r.status_code == 422
 
 
+@pytest.mark.parametrize(
+    "body",
+    [b"{not json", b"[]", b'{"rows": {"a": 1}}', b'{"rows": [1, 2]}'],
+)
+def test_predict_malformed_body_422(client: TestClient, body: bytes) -> None:
+    r = client.post(
+        "/predict", content=body, headers={"content-type": "application/json"}
+    )
+    assert r.status_code == 422
+
+
+def test_predict_request_body_is_documented(client: TestClient) -> None:
+    spec = client.get("/openapi.json").json()
+    body = spec["paths"]["/predict"]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+    assert body["required"] is True
+    assert "rows" in schema["required"]
+
+
 def test_request_id_header_is_echoed_if_provided(client: TestClient) -> None:
     rid = "test-rid-123"
     r = client.post(
@@ -123,3 +143,216 @@ def test_canary_bucket_is_stable_for_same_request_id(client: TestClient) -> None
     assert r1.json()["bucket"] == r2.json()["bucket"]
     assert r1.json()["bucket_seed_source"] == "request_id"
     assert r2.json()["bucket_seed_source"] == "request_id"
+
+
+class _Schema:
+    def __init__(self, names: list[str], types: list[str] | None = None) -> None:
+        self._names = names
+        self._types = types or ["string"] * len(names)
+
+    def has_input_names(self) -> bool:
+        return True
+
+    def input_names(self) -> list[str]:
+        return self._names
+
+    def input_types(self) -> list[Any]:
+        # Stand-ins for mlflow DataType members (only `.name` is read).
+        return [type("DataType", (), {"name": t})() for t in self._types]
+
+
+class _Metadata:
+    def __init__(self, names: list[str], types: list[str] | None = None) -> None:
+        self._schema = _Schema(names, types)
+
+    def get_input_schema(self) -> _Schema:
+        return self._schema
+
+
+class _SignatureModel(_FakeModel):
+    """Fake model exposing an MLflow-style signature; records the frames it sees."""
+
+    __hash__ = None  # type: ignore[assignment]  # unhashable, like mlflow's PyFuncModel
+
+    def __init__(
+        self, value: float, names: list[str], types: list[str] | None = None
+    ) -> None:
+        super().__init__(value)
+        self.metadata = _Metadata(names, types)
+        self.seen_columns: list[list[str]] = []
+        self.seen_frames: list[pd.DataFrame] = []
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        self.seen_columns.append(list(df.columns))
+        self.seen_frames.append(df)
+        return super().predict(df)
+
+
+def test_predict_builds_frame_in_signature_column_order(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import serving.app as app_module
+
+    model = _SignatureModel(0.3, ["mean texture", "mean radius"])
+    monkeypatch.setattr(app_module, "model_prod", model)
+
+    r = client.post("/predict?mode=prod", json=_payload())
+
+    assert r.status_code == 200, r.text
+    assert r.json()["proba"] == [0.3]
+    assert model.seen_columns == [["mean texture", "mean radius"]]
+
+
+def test_double_signature_builds_dense_float_frame(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import serving.app as app_module
+
+    model = _SignatureModel(0.3, ["mean texture", "mean radius"], ["double"] * 2)
+    monkeypatch.setattr(app_module, "model_prod", model)
+
+    rows = [{"mean radius": 14.0, "mean texture": 20}, {"mean texture": 21.5}]
+    r = client.post("/predict?mode=prod", json={"rows": rows[:1]})
+    assert r.status_code == 200, r.text
+    df = model.seen_frames[-1]
+    assert list(df.dtypes) == [np.float64, np.float64]
+    assert df.to_numpy().tolist() == [[20.0, 14.0]]
+
+    # A feature no row sends is an input error, not a NaN-filled column.
+    r = client.post("/predict?mode=prod", json={"rows": rows[1:]})
+    assert r.status_code == 422
+    assert "mean radius" in r.text
+    assert len(model.seen_frames) == 1
+    with pytest.raises(ValueError, match="missing inputs"):
+        app_module._to_frame(model, rows[1:])
+
+    # Booleans are not doubles: they must reach schema enforcement as-is
+    # instead of being coerced to 1.0 / 0.0 by the dense path.
+    df = app_module._to_frame(model, [{"mean radius": True, "mean texture": 20.0}])
+    assert df["mean radius"].tolist() == [True]
+    single = _SignatureModel(0.3, ["mean radius"], ["double"])
+    assert app_module._to_frame(single, [{"mean radius": False}]).dtypes.iloc[0] == bool
+    assert (
+        app_module._to_frame(single, [{"mean radius": 1}]).dtypes.iloc[0] == np.float64
+    )
+
+
+def test_wrong_shape_model_output_fails_instead_of_misaligning(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import serving.app as app_module
+
+    class _TwoColumnModel(_FakeModel):
+        def predict(self, df: pd.DataFrame) -> np.ndarray:
+            return np.full((len(df), 2), self._value)
+
+    monkeypatch.setattr(app_module, "model_prod", _TwoColumnModel(0.3))
+    r = client.post("/predict?mode=prod", json=_payload())
+    assert r.status_code == 500
+
+    with pytest.raises(ValueError, match="one score per row"):
+        app_module._as_scores(np.zeros((3, 2)), 3)
+    assert app_module._as_scores(np.zeros((3, 1)), 3).shape == (3,)
+
+
+def test_repeat_payload_is_served_from_cache(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import serving.app as app_module
+
+    model = _SignatureModel(0.4, ["mean radius"])
+    monkeypatch.setattr(app_module, "model_prod", model)
+
+    first = client.post("/predict?mode=prod", json=_payload())
+    second = client.post("/predict?mode=prod", json=_payload())
+
+    assert first.json()["proba"] == second.json()["proba"] == [0.4]
+    assert len(model.seen_columns) == 1
+
+    # Shadow runs always predict, even for a cached payload.
+    client.post("/predict?mode=shadow", json=_payload())
+    assert len(model.seen_columns) == 2
+
+
+def test_non_canary_modes_skip_bucketing(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import serving.app as app_module
+
+    def _no_bucket(_ctx: Any) -> Any:
+        raise AssertionError("only canary requests are bucketed")
+
+    monkeypatch.setattr(app_module, "choose_canary_bucket", _no_bucket)
+
+    for mode in ("prod", "candidate", "shadow"):
+        r = client.post(f"/predict?mode={mode}", json=_payload())
+        assert r.status_code == 200
+        assert r.json()["bucket"] is None
+
+
+def test_large_responses_are_streamed_as_the_same_json(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import serving.app as app_module
+
+    monkeypatch.setattr(app_module, "STREAM_MIN_ROWS", 3)
+    monkeypatch.setattr(app_module, "STREAM_CHUNK_ROWS", 2)
+
+    small = client.post("/predict?mode=prod", json={"rows": [{"x": 1.0}] * 2})
+    large = client.post("/predict?mode=prod", json={"rows": [{"x": 1.0}] * 5})
+
+    assert "content-length" in small.headers
+    assert "content-length" not in large.headers
+    assert large.json() == {**small.json(), "n": 5, "proba": [0.2] * 5}
+
+
+def test_shadow_model_predicts_concurrently_with_primary(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    import threading
+
+    import serving.app as app_module
+
+    # Each predict waits for the other: only passes if both run at once.
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    class _Rendezvous(_FakeModel):
+        def predict(self, df: pd.DataFrame) -> np.ndarray:
+            barrier.wait()
+            return super().predict(df)
+
+    monkeypatch.setattr(app_module, "model_prod", _Rendezvous(0.2))
+    monkeypatch.setattr(app_module, "model_candidate", _Rendezvous(0.8))
+
+    r = client.post("/predict?mode=shadow", json=_payload())
+    assert r.status_code == 200, r.text
+    assert r.json()["proba"] == [0.2]
+
+
+def test_cache_hits_are_counted_and_reload_clears_cache(
+    client: TestClient, monkeypatch: MonkeyPatch
+) -> None:
+    from prometheus_client import REGISTRY
+
+    import serving.app as app_module
+
+    def _hits() -> float:
+        return REGISTRY.get_sample_value("predict_cache_hits_total") or 0.0
+
+    old = _SignatureModel(0.4, ["mean radius"])
+    monkeypatch.setattr(app_module, "model_prod", old)
+    base = _hits()
+
+    client.post("/predict?mode=prod", json=_payload())
+    client.post("/predict?mode=prod", json=_payload())
+    assert _hits() == base + 1
+
+    # Same alias and version, new model object: must not answer from the cache.
+    new = _SignatureModel(0.6, ["mean radius"])
+    monkeypatch.setattr(app_module, "_load_model", lambda _settings, _alias: new)
+    monkeypatch.setattr(app_module, "model_prod", None)
+    monkeypatch.setattr(app_module, "_last_refresh_ts", float("-inf"))
+
+    r = client.post("/predict?mode=prod", json=_payload())
+    assert r.json()["proba"] == [0.6]
+    assert _hits() == base + 1
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from serving.batching import MicroBatcher
+
+
+def _echo_batcher(calls: list[tuple[Any, int]], **kwargs: Any) -> MicroBatcher[Any]:
+    def run_batch(key: Any, rows: list[dict[str, Any]]) -> list[float]:
+        calls.append((key, len(rows)))
+        return [float(r["x"]) for r in rows]
+
+    return MicroBatcher(
+        run_batch, lambda result, off, n: result[off : off + n], **kwargs
+    )
+
+
+def test_concurrent_submits_share_one_call() -> None:
+    calls: list[tuple[Any, int]] = []
+    batcher = _echo_batcher(calls, max_batch_size=100, max_wait_s=0.01)
+
+    async def run() -> tuple[Any, ...]:
+        return await asyncio.gather(
+            batcher.submit("k", [{"x": 1}, {"x": 2}]),
+            batcher.submit("k", [{"x": 3}]),
+            batcher.submit("other", [{"x": 4}]),
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [[1.0, 2.0], [3.0], [4.0]]
+    assert sorted(calls) == [("k", 3), ("other", 1)]
+
+
+def test_full_batch_flushes_without_waiting() -> None:
+    calls: list[tuple[Any, int]] = []
+    batcher = _echo_batcher(calls, max_batch_size=2, max_wait_s=60.0)
+
+    async def run() -> tuple[Any, ...]:
+        return await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("k", [{"x": 1}]), batcher.submit("k", [{"x": 2}])
+            ),
+            timeout=1.0,
+        )
+
+    assert asyncio.run(run()) == [[1.0], [2.0]]
+    assert calls == [("k", 2)]
+
+
+def test_batch_error_stays_with_the_failing_request() -> None:
+    calls: list[tuple[Any, int]] = []
+    batcher = _echo_batcher(calls, max_batch_size=10, max_wait_s=0.01)
+
+    async def run() -> tuple[Any, ...]:
+        return await asyncio.gather(
+            batcher.submit("k", [{"x": 1}]),
+            batcher.submit("k", [{"x": "not a number"}]),
+            batcher.submit("k", [{"x": 3}, {"x": 4}]),
+            return_exceptions=True,
+        )
+
+    ok, bad, ok_too = asyncio.run(run())
+
+    assert ok == [1.0]
+    assert isinstance(bad, ValueError)
+    assert ok_too == [3.0, 4.0]
+    # One failed batch call, then one retry per request.
+    assert sorted(n for _, n in calls) == [1, 1, 2, 4]
+
+
+def test_zero_wait_disables_batching() -> None:
+    calls: list[tuple[Any, int]] = []
+    batcher = _echo_batcher(calls, max_batch_size=100, max_wait_s=0.0)
+
+    assert asyncio.run(batcher.submit("k", [{"x": 5}])) == [5.0]
+    assert calls == [("k", 1)]
+
+
+def test_idle_batcher_does_not_wait() -> None:
+    calls: list[tuple[Any, int]] = []
+    batcher = _echo_batcher(calls, max_batch_size=100, max_wait_s=60.0)
+
+    async def run() -> Any:
+        return await asyncio.wait_for(batcher.submit("k", [{"x": 1}]), timeout=1.0)
+
+    assert asyncio.run(run()) == [1.0]
+    assert calls == [("k", 1)]
+
+
+def test_requests_queue_behind_a_running_batch() -> None:
+    import threading
+
+    calls: list[tuple[Any, int]] = []
+    release = threading.Event()
+
+    def run_batch(key: Any, rows: list[dict[str, Any]]) -> list[float]:
+        calls.append((key, len(rows)))
+        if len(calls) == 1:
+            release.wait(timeout=5.0)
+        return [float(r["x"]) for r in rows]
+
+    batcher: MicroBatcher[Any] = MicroBatcher(
+        run_batch,
+        lambda result, off, n: result[off : off + n],
+        max_batch_size=100,
+        max_wait_s=60.0,
+    )
+
+    async def run() -> list[Any]:
+        first = asyncio.ensure_future(batcher.submit("k", [{"x": 1}]))
+        while not calls:
+            await asyncio.sleep(0.001)
+        later = [asyncio.ensure_future(batcher.submit("k", [{"x": x}])) for x in (2, 3)]
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.wait_for(asyncio.gather(first, *later), timeout=1.0)
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [3.0]]
+    assert calls == [("k", 1), ("k", 2)]
+
+
+def test_split_error_stays_with_its_request() -> None:
+    def split(result: list[float], off: int, n: int) -> list[float]:
+        if off:
+            raise IndexError("bad slice")
+        return result[off : off + n]
+
+    batcher: MicroBatcher[Any] = MicroBatcher(
+        lambda _key, rows: [float(r["x"]) for r in rows],
+        split,
+        max_batch_size=100,
+        max_wait_s=0.01,
+    )
+
+    async def run() -> tuple[Any, ...]:
+        return await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("k", [{"x": 1}]),
+                batcher.submit("k", [{"x": 2}]),
+                return_exceptions=True,
+            ),
+            timeout=5.0,
+        )
+
+    first, second = asyncio.run(run())
+    assert first == [1.0]
+    assert isinstance(second, IndexError)
@@ -1,23 +1,20 @@
 from __future__ import annotations
 
-import re
+from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
+from prometheus_client.parser import text_string_to_metric_families
 
 from serving.app import app
 
 
 def _get_metric_value(text: str, metric_name: str, *, labels: dict[str, str]) -> float:
-    # Prometheus exposition: metric{a="b",c="d"} 123
-    label_str = ",".join([f'{k}="{v}"' for k, v in labels.items()])
-    pattern = (
-        rf"^{re.escape(metric_name)}\{{{re.escape(label_str)}\}}\s+([0-9eE\.\+\-]+)$"
-    )
-
-    for line in text.splitlines():
-        m = re.match(pattern, line)
-        if m:
-            return float(m.group(1))
+    # Match on sample names: counter families drop the "_total" suffix.
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if sample.name == metric_name and sample.labels == labels:
+                return sample.value
     raise AssertionError(f"Metric not found: {metric_name} labels={labels}")
 
 
@@ -55,3 +52,92 @@ def test_predict_increments_metrics() -> None:
         labels={"endpoint": "/predict", "mode": "prod", "status": "200"},
     )
     assert after_count == base_count + 1
+
+
+def test_metrics_middleware_records_error_status() -> None:
+    client = TestClient(app)
+
+    labels = {"endpoint": "/predict", "mode": "prod", "status": "422"}
+    try:
+        base_count = _get_metric_value(
+            client.get("/metrics").text, "requests_total", labels=labels
+        )
+    except AssertionError:
+        base_count = 0.0
+
+    r = client.post("/predict?mode=prod", json={"not_rows": []})
+    assert r.status_code == 422
+
+    after = client.get("/metrics").text
+    assert _get_metric_value(after, "requests_total", labels=labels) == base_count + 1
+
+
+def test_metrics_labels_are_bounded() -> None:
+    client = TestClient(app)
+
+    client.get("/no-such-path-123")
+    client.post("/predict?mode=bogus", json={"rows": []})
+
+    text = client.get("/metrics").text
+    assert "no-such-path-123" not in text
+    assert 'mode="bogus"' not in text
+    assert 'endpoint="other"' in text
+    assert 'mode="invalid"' in text
+
+
+def test_shadow_mae_is_sampled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from serving.constants import ENV_SHADOW_MAE_SAMPLE_RATE
+    from serving.settings import get_settings
+
+    client = TestClient(app)
+    labels = {"mode": "shadow"}
+    payload = {"rows": [{"mean_radius": 14.0}]}
+
+    def _observed() -> float:
+        try:
+            return _get_metric_value(
+                client.get("/metrics").text, "shadow_diff_mae_count", labels=labels
+            )
+        except AssertionError:
+            return 0.0
+
+    base = _observed()
+    assert client.post("/predict?mode=shadow", json=payload).status_code == 200
+    assert _observed() == base + 1
+
+    monkeypatch.setenv(ENV_SHADOW_MAE_SAMPLE_RATE, "0")
+    get_settings.cache_clear()
+    assert client.post("/predict?mode=shadow", json=payload).status_code == 200
+    assert _observed() == base + 1
+
+
+def test_multiprocess_mode_aggregates_from_shared_dir(tmp_path: Path) -> None:
+    import os
+    import subprocess
+    import sys
+
+    # prometheus_client picks its value store at import: needs a fresh process.
+    script = """
+from fastapi.testclient import TestClient
+from serving.app import app
+c = TestClient(app)
+c.post("/predict?mode=prod", json={"rows": [{"x": 1.0}]})
+print(c.get("/metrics").text)
+"""
+    env = {
+        **os.environ,
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+        "UNIT_TESTING": "true",
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[2],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert any(tmp_path.glob("*.db"))
+    labels = {"endpoint": "/predict", "mode": "prod", "status": "200"}
+    assert _get_metric_value(out, "requests_total", labels=labels) == 1.0
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from serving.prediction_cache import TTLLRUCache, rows_digest
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rows_digest_ignores_key_order() -> None:
+    assert rows_digest([{"a": 1.0, "b": 2.0}]) == rows_digest([{"b": 2.0, "a": 1.0}])
+    assert rows_digest([{"a": 1.0}]) != rows_digest([{"a": 1.5}])
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache = TTLLRUCache(maxsize=10, ttl_s=5.0, clock=clock)
+    cache.put("k", 1)
+
+    clock.now = 4.9
+    assert cache.get("k") == 1
+    clock.now = 5.0
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = TTLLRUCache(maxsize=2, ttl_s=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from typing import NoReturn
+
+import pandas as pd
 from fastapi.testclient import TestClient
 from _pytest.monkeypatch import MonkeyPatch
 
 import serving.app as appmod
+from serving.settings import Settings, get_settings
 
 
 def _client() -> TestClient:
     return TestClient(appmod.app)
 
 
+def _loadable(
+    ok: bool, detail: str | None = None
+) -> Callable[[Settings], Awaitable[tuple[bool, str | None]]]:
+    async def _stub(_settings: Settings) -> tuple[bool, str | None]:
+        return ok, detail
+
+    return _stub
+
+
 def test_livez_is_always_200() -> None:
     c = _client()
     r = c.get("/livez")
@@ -23,7 +37,7 @@ def test_readyz_returns_503_when_registry_unreachable(monkeypatch: MonkeyPatch)
         "_registry_resolves_prod_alias",
         lambda _settings: (False, "registry down"),
     )
-    monkeypatch.setattr(appmod, "_prod_model_loadable", lambda _settings: (True, None))
+    monkeypatch.setattr(appmod, "_prod_model_loadable", _loadable(True))
 
     c = _client()
     r = c.get("/readyz")
@@ -40,7 +54,7 @@ def test_readyz_returns_503_when_prod_model_not_loadable(
     monkeypatch.setattr(
         appmod,
         "_prod_model_loadable",
-        lambda _settings: (False, "prod model not loadable"),
+        _loadable(False, "prod model not loadable"),
     )
 
     c = _client()
@@ -55,7 +69,7 @@ def test_readyz_returns_200_when_registry_ok_and_prod_model_loadable(
     monkeypatch.setattr(
         appmod, "_registry_resolves_prod_alias", lambda _settings: (True, None)
     )
-    monkeypatch.setattr(appmod, "_prod_model_loadable", lambda _settings: (True, None))
+    monkeypatch.setattr(appmod, "_prod_model_loadable", _loadable(True))
 
     c = _client()
     r = c.get("/readyz")
@@ -81,3 +95,202 @@ def test_health_exposes_readiness_flags(monkeypatch: MonkeyPatch) -> None:
     assert body["prod_model_loaded"] is True
     assert body["ready"] is True
     assert body["prod_version"] == "123"
+
+
+def test_startup_loads_prod_model() -> None:
+    assert appmod.model_prod is None
+
+    with TestClient(appmod.app):
+        assert appmod.model_prod is not None
+
+
+def test_predict_returns_503_when_model_load_times_out(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import time
+
+    from serving.constants import ENV_MODEL_LOAD_TIMEOUT_SEC
+    from serving.settings import get_settings
+
+    monkeypatch.setenv(ENV_MODEL_LOAD_TIMEOUT_SEC, "0.05")
+    get_settings.cache_clear()
+
+    def _slow_load(_settings: Settings, _alias: str) -> NoReturn:
+        # Never assigns a model, so the abandoned thread cannot leak into other tests.
+        time.sleep(0.3)
+        raise RuntimeError("load aborted")
+
+    monkeypatch.setattr(appmod, "_load_model", _slow_load)
+
+    r = _client().post("/predict?mode=prod", json={"rows": [{"x": 1.0}]})
+    assert r.status_code == 503
+    assert "timed out" in r.text
+
+
+def test_timed_out_model_load_is_joined_not_restarted(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import asyncio
+    import threading
+
+    import pytest
+
+    from serving.constants import ENV_MODEL_LOAD_TIMEOUT_SEC
+    from serving.prediction_cache import TTLLRUCache
+
+    monkeypatch.setenv(ENV_MODEL_LOAD_TIMEOUT_SEC, "0.05")
+    get_settings.cache_clear()
+
+    release = threading.Event()
+    calls: list[str] = []
+    model = object()
+
+    def _load(_settings: Settings, alias: str) -> object:
+        calls.append(alias)
+        release.wait(5.0)
+        return model
+
+    monkeypatch.setattr(appmod, "_load_model", _load)
+    cache = TTLLRUCache(maxsize=4, ttl_s=60.0)
+    cache.put("stale", 1.0)
+    monkeypatch.setattr(appmod, "_predict_cache", cache)
+
+    async def _scenario() -> None:
+        settings = get_settings()
+        for _ in range(3):
+            with pytest.raises(RuntimeError, match="timed out"):
+                await appmod._ensure_models_loaded(settings, load_candidate=False)
+        release.set()
+        await appmod._ensure_models_loaded(settings, load_candidate=False)
+
+    try:
+        asyncio.run(_scenario())
+    finally:
+        release.set()
+
+    assert calls == ["prod"]
+    assert appmod.model_prod is model
+    assert len(cache) == 0
+
+
+def test_registry_check_is_cached_between_probes(monkeypatch: MonkeyPatch) -> None:
+    calls: list[object] = []
+
+    def _check(settings: Settings) -> tuple[bool, str | None]:
+        calls.append(settings)
+        return True, None
+
+    monkeypatch.setattr(appmod, "_registry_resolves_prod_alias", _check)
+    monkeypatch.setattr(appmod, "_prod_model_loadable", _loadable(True))
+
+    c = _client()
+    assert c.get("/readyz").status_code == 200
+    assert c.get("/health").json()["registry_ok"] is True
+    assert len(calls) == 1
+
+
+def test_hung_registry_runs_one_check_and_backs_off(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import threading
+
+    from serving.constants import ENV_REGISTRY_CHECK_TIMEOUT_SEC
+
+    monkeypatch.setenv(ENV_REGISTRY_CHECK_TIMEOUT_SEC, "0.05")
+    get_settings.cache_clear()
+
+    release = threading.Event()
+    calls: list[Settings] = []
+
+    def _hung_check(settings: Settings) -> tuple[bool, str | None]:
+        calls.append(settings)
+        release.wait(timeout=5.0)
+        return True, None
+
+    monkeypatch.setattr(appmod, "_registry_resolves_prod_alias", _hung_check)
+
+    c = _client()
+    try:
+        body = c.get("/health").json()
+        assert body["registry_ok"] is False
+        assert "timed out" in body["registry_detail"]
+
+        # The timeout is recorded: probes within the TTL don't start new checks.
+        assert c.get("/readyz").status_code == 503
+        assert len(calls) == 1
+    finally:
+        release.set()
+        assert appmod._registry_future is not None
+        appmod._registry_future.result(timeout=5.0)
+
+
+def test_expired_probe_reuses_the_in_flight_check(monkeypatch: MonkeyPatch) -> None:
+    import threading
+
+    from serving.constants import (
+        ENV_REGISTRY_CHECK_TIMEOUT_SEC,
+        ENV_REGISTRY_CHECK_TTL_SEC,
+    )
+
+    monkeypatch.setenv(ENV_REGISTRY_CHECK_TTL_SEC, "0")
+    monkeypatch.setenv(ENV_REGISTRY_CHECK_TIMEOUT_SEC, "0.05")
+    get_settings.cache_clear()
+
+    release = threading.Event()
+    calls: list[Settings] = []
+
+    def _hung_check(settings: Settings) -> tuple[bool, str | None]:
+        calls.append(settings)
+        release.wait(timeout=5.0)
+        return True, None
+
+    monkeypatch.setattr(appmod, "_registry_resolves_prod_alias", _hung_check)
+
+    c = _client()
+    try:
+        for _ in range(3):
+            assert c.get("/health").json()["registry_ok"] is False
+        assert len(calls) == 1
+    finally:
+        release.set()
+        assert appmod._registry_future is not None
+        appmod._registry_future.result(timeout=5.0)
+
+    # Once the check finishes, the next probe sees its result.
+    assert c.get("/health").json()["registry_ok"] is True
+
+
+def test_startup_loads_candidate_and_warms_models(monkeypatch: MonkeyPatch) -> None:
+    class _Schema:
+        def has_input_names(self) -> bool:
+            return True
+
+        def input_names(self) -> list[str]:
+            return ["a", "b"]
+
+    class _Metadata:
+        def get_input_schema(self) -> _Schema:
+            return _Schema()
+
+    class _Model:
+        metadata = _Metadata()
+
+        def __init__(self) -> None:
+            self.frames: list[list[str]] = []
+
+        def predict(self, df: pd.DataFrame) -> list[float]:
+            self.frames.append(list(df.columns))
+            return [0.5] * len(df)
+
+    loaded: dict[str, _Model] = {}
+
+    def _load(_settings: Settings, alias: str) -> _Model:
+        loaded[alias] = _Model()
+        return loaded[alias]
+
+    monkeypatch.setattr(appmod, "_load_model", _load)
+
+    with TestClient(appmod.app):
+        assert appmod.model_candidate is loaded["candidate"]
+        assert loaded["prod"].frames == [["a", "b"]]
+        assert loaded["candidate"].frames == [["a", "b"]]
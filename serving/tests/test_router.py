@@ -7,6 +7,7 @@ from serving.router import (
     SeedSource,
     choose_canary_bucket,
     decide_routing,
+    stable_bucket_from_str,
 )
 
 
@@ -77,3 +78,29 @@ def test_payload_hash_fallback_is_stable() -> None:
     b2 = choose_canary_bucket(ctx)
     assert b1.bucket == b2.bucket
     assert b1.seed_source == SeedSource.PAYLOAD_HASH
+
+
+def test_request_id_buckets_are_spread_evenly() -> None:
+    from collections import Counter
+
+    counts = Counter(stable_bucket_from_str(f"req-{i}") for i in range(20_000))
+
+    assert set(counts) == set(range(100))
+    # ~200 per bucket; a badly mixed hash would be far off.
+    assert min(counts.values()) > 120
+    assert max(counts.values()) < 280
+
+
+def test_payload_bucket_ignores_key_order() -> None:
+    from serving.router import stable_bucket_from_rows
+
+    assert stable_bucket_from_rows([{"x": 1, "y": 2.5}]) == stable_bucket_from_rows(
+        [{"y": 2.5, "x": 1}]
+    )
+
+
+def test_decisions_are_shared_instances() -> None:
+    assert decide_routing("canary", 10, 5) is decide_routing("canary", 50, 0)
+    assert decide_routing("prod", 10, 5) is decide_routing("prod", 90, 99)
+    with pytest.raises(ValueError):
+        decide_routing("bogus", 10, 5)  # type: ignore[arg-type]